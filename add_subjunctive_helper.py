@@ -4,333 +4,527 @@ Helper script to add subjunctive conjugations to Spanish verbs.
 This generates the subjunctive forms based on verb stem patterns.
 """
 
+import argparse
 import json
+import os
 import re
+import sys
+import time
 
-# Subjunctive conjugation patterns based on Spanish grammar rules
-# For regular verbs, these follow the standard patterns
-# For irregular verbs, we'll provide manual mappings
+import profiling
+from morph_cache import cache_stats, configure, memoized
+
+# Subjunctive forms are generated from the catalog's own paradigms by rule:
+# the present subjunctive from the present yo stem (which already carries
+# -g-/-zc- stems and stem changes), the imperfect subjunctive from the
+# preterite ellos stem. Only true suppletives need hand-written forms, plus
+# pedir, which is not in the catalog as a bare verb, so its stem change
+# cannot be read off a stored present.
 
 SUBJUNCTIVE_CONJUGATIONS = {
-    # Key: Spanish infinitive, Value: dict of tense -> conjugations
+    # Key: Spanish infinitive, Value: dict of tense -> conjugations that override the rules
     "ser": {
         "Present Subjunctive": ["sea", "seas", "sea", "seamos", "seáis", "sean"],
         "Imperfect Subjunctive": ["fuera", "fueras", "fuera", "fuéramos", "fuerais", "fueran"],
-        "Present Perfect Subjunctive": ["haya sido", "hayas sido", "haya sido", "hayamos sido", "hayáis sido", "hayan sido"],
-        "Past Perfect Subjunctive": ["hubiera sido", "hubieras sido", "hubiera sido", "hubiéramos sido", "hubierais sido", "hubieran sido"]
-    },
-    "estar": {
-        "Present Subjunctive": ["esté", "estés", "esté", "estemos", "estéis", "estén"],
-        "Imperfect Subjunctive": ["estuviera", "estuvieras", "estuviera", "estuviéramos", "estuvierais", "estuvieran"],
-        "Present Perfect Subjunctive": ["haya estado", "hayas estado", "haya estado", "hayamos estado", "hayáis estado", "hayan estado"],
-        "Past Perfect Subjunctive": ["hubiera estado", "hubieras estado", "hubiera estado", "hubiéramos estado", "hubierais estado", "hubieran estado"]
-    },
-    "tener": {
-        "Present Subjunctive": ["tenga", "tengas", "tenga", "tengamos", "tengáis", "tengan"],
-        "Imperfect Subjunctive": ["tuviera", "tuvieras", "tuviera", "tuviéramos", "tuvierais", "tuvieran"],
-        "Present Perfect Subjunctive": ["haya tenido", "hayas tenido", "haya tenido", "hayamos tenido", "hayáis tenido", "hayan tenido"],
-        "Past Perfect Subjunctive": ["hubiera tenido", "hubieras tenido", "hubiera tenido", "hubiéramos tenido", "hubierais tenido", "hubieran tenido"]
-    },
-    "haber": {
-        "Present Subjunctive": ["haya", "hayas", "haya", "hayamos", "hayáis", "hayan"],
-        "Imperfect Subjunctive": ["hubiera", "hubieras", "hubiera", "hubiéramos", "hubierais", "hubieran"],
-        "Present Perfect Subjunctive": ["haya habido", "hayas habido", "haya habido", "hayamos habido", "hayáis habido", "hayan habido"],
-        "Past Perfect Subjunctive": ["hubiera habido", "hubieras habido", "hubiera habido", "hubiéramos habido", "hubierais habido", "hubieran habido"]
-    },
-    "hacer": {
-        "Present Subjunctive": ["haga", "hagas", "haga", "hagamos", "hagáis", "hagan"],
-        "Imperfect Subjunctive": ["hiciera", "hicieras", "hiciera", "hiciéramos", "hicierais", "hicieran"],
-        "Present Perfect Subjunctive": ["haya hecho", "hayas hecho", "haya hecho", "hayamos hecho", "hayáis hecho", "hayan hecho"],
-        "Past Perfect Subjunctive": ["hubiera hecho", "hubieras hecho", "hubiera hecho", "hubiéramos hecho", "hubierais hecho", "hubieran hecho"]
-    },
-    "poder": {
-        "Present Subjunctive": ["pueda", "puedas", "pueda", "podamos", "podáis", "puedan"],
-        "Imperfect Subjunctive": ["pudiera", "pudieras", "pudiera", "pudiéramos", "pudierais", "pudieran"],
-        "Present Perfect Subjunctive": ["haya podido", "hayas podido", "haya podido", "hayamos podido", "hayáis podido", "hayan podido"],
-        "Past Perfect Subjunctive": ["hubiera podido", "hubieras podido", "hubiera podido", "hubiéramos podido", "hubierais podido", "hubieran podido"]
-    },
-    "decir": {
-        "Present Subjunctive": ["diga", "digas", "diga", "digamos", "digáis", "digan"],
-        "Imperfect Subjunctive": ["dijera", "dijeras", "dijera", "dijéramos", "dijerais", "dijeran"],
-        "Present Perfect Subjunctive": ["haya dicho", "hayas dicho", "haya dicho", "hayamos dicho", "hayáis dicho", "hayan dicho"],
-        "Past Perfect Subjunctive": ["hubiera dicho", "hubieras dicho", "hubiera dicho", "hubiéramos dicho", "hubierais dicho", "hubieran dicho"]
     },
+    "estar": {"Present Subjunctive": ["esté", "estés", "esté", "estemos", "estéis", "estén"]},
     "ir": {
         "Present Subjunctive": ["vaya", "vayas", "vaya", "vayamos", "vayáis", "vayan"],
         "Imperfect Subjunctive": ["fuera", "fueras", "fuera", "fuéramos", "fuerais", "fueran"],
-        "Present Perfect Subjunctive": ["haya ido", "hayas ido", "haya ido", "hayamos ido", "hayáis ido", "hayan ido"],
-        "Past Perfect Subjunctive": ["hubiera ido", "hubieras ido", "hubiera ido", "hubiéramos ido", "hubierais ido", "hubieran ido"]
-    },
-    "ver": {
-        "Present Subjunctive": ["vea", "veas", "vea", "veamos", "veáis", "vean"],
-        "Imperfect Subjunctive": ["viera", "vieras", "viera", "viéramos", "vierais", "vieran"],
-        "Present Perfect Subjunctive": ["haya visto", "hayas visto", "haya visto", "hayamos visto", "hayáis visto", "hayan visto"],
-        "Past Perfect Subjunctive": ["hubiera visto", "hubieras visto", "hubiera visto", "hubiéramos visto", "hubierais visto", "hubieran visto"]
-    },
-    "dar": {
-        "Present Subjunctive": ["dé", "des", "dé", "demos", "deis", "den"],
-        "Imperfect Subjunctive": ["diera", "dieras", "diera", "diéramos", "dierais", "dieran"],
-        "Present Perfect Subjunctive": ["haya dado", "hayas dado", "haya dado", "hayamos dado", "hayáis dado", "hayan dado"],
-        "Past Perfect Subjunctive": ["hubiera dado", "hubieras dado", "hubiera dado", "hubiéramos dado", "hubierais dado", "hubieran dado"]
-    },
-    "saber": {
-        "Present Subjunctive": ["sepa", "sepas", "sepa", "sepamos", "sepáis", "sepan"],
-        "Imperfect Subjunctive": ["supiera", "supieras", "supiera", "supiéramos", "supierais", "supieran"],
-        "Present Perfect Subjunctive": ["haya sabido", "hayas sabido", "haya sabido", "hayamos sabido", "hayáis sabido", "hayan sabido"],
-        "Past Perfect Subjunctive": ["hubiera sabido", "hubieras sabido", "hubiera sabido", "hubiéramos sabido", "hubierais sabido", "hubieran sabido"]
-    },
-    "conocer": {
-        "Present Subjunctive": ["conozca", "conozcas", "conozca", "conozcamos", "conozcáis", "conozcan"],
-        "Imperfect Subjunctive": ["conociera", "conocieras", "conociera", "conociéramos", "conocierais", "conocieran"],
-        "Present Perfect Subjunctive": ["haya conocido", "hayas conocido", "haya conocido", "hayamos conocido", "hayáis conocido", "hayan conocido"],
-        "Past Perfect Subjunctive": ["hubiera conocido", "hubieras conocido", "hubiera conocido", "hubiéramos conocido", "hubierais conocido", "hubieran conocido"]
-    },
-    "querer": {
-        "Present Subjunctive": ["quiera", "quieras", "quiera", "queramos", "queráis", "quieran"],
-        "Imperfect Subjunctive": ["quisiera", "quisieras", "quisiera", "quisiéramos", "quisierais", "quisieran"],
-        "Present Perfect Subjunctive": ["haya querido", "hayas querido", "haya querido", "hayamos querido", "hayáis querido", "hayan querido"],
-        "Past Perfect Subjunctive": ["hubiera querido", "hubieras querido", "hubiera querido", "hubiéramos querido", "hubierais querido", "hubieran querido"]
-    },
-    "llegar": {
-        "Present Subjunctive": ["llegue", "llegues", "llegue", "lleguemos", "lleguéis", "lleguen"],
-        "Imperfect Subjunctive": ["llegara", "llegaras", "llegara", "llegáramos", "llegarais", "llegaran"],
-        "Present Perfect Subjunctive": ["haya llegado", "hayas llegado", "haya llegado", "hayamos llegado", "hayáis llegado", "hayan llegado"],
-        "Past Perfect Subjunctive": ["hubiera llegado", "hubieras llegado", "hubiera llegado", "hubiéramos llegado", "hubierais llegado", "hubieran llegado"]
-    },
-    "pasar": {
-        "Present Subjunctive": ["pase", "pases", "pase", "pasemos", "paséis", "pasen"],
-        "Imperfect Subjunctive": ["pasara", "pasaras", "pasara", "pasáramos", "pasarais", "pasaran"],
-        "Present Perfect Subjunctive": ["haya pasado", "hayas pasado", "haya pasado", "hayamos pasado", "hayáis pasado", "hayan pasado"],
-        "Past Perfect Subjunctive": ["hubiera pasado", "hubieras pasado", "hubiera pasado", "hubiéramos pasado", "hubierais pasado", "hubieran pasado"]
-    },
-    "poner": {
-        "Present Subjunctive": ["ponga", "pongas", "ponga", "pongamos", "pongáis", "pongan"],
-        "Imperfect Subjunctive": ["pusiera", "pusieras", "pusiera", "pusiéramos", "pusierais", "pusieran"],
-        "Present Perfect Subjunctive": ["haya puesto", "hayas puesto", "haya puesto", "hayamos puesto", "hayáis puesto", "hayan puesto"],
-        "Past Perfect Subjunctive": ["hubiera puesto", "hubieras puesto", "hubiera puesto", "hubiéramos puesto", "hubierais puesto", "hubieran puesto"]
-    },
-    "parecer": {
-        "Present Subjunctive": ["parezca", "parezcas", "parezca", "parezcamos", "parezcáis", "parezcan"],
-        "Imperfect Subjunctive": ["pareciera", "parecieras", "pareciera", "pareciéramos", "parecierais", "parecieran"],
-        "Present Perfect Subjunctive": ["haya parecido", "hayas parecido", "haya parecido", "hayamos parecido", "hayáis parecido", "hayan parecido"],
-        "Past Perfect Subjunctive": ["hubiera parecido", "hubieras parecido", "hubiera parecido", "hubiéramos parecido", "hubierais parecido", "hubieran parecido"]
-    },
-    "quedar": {
-        "Present Subjunctive": ["quede", "quedes", "quede", "quedemos", "quedéis", "queden"],
-        "Imperfect Subjunctive": ["quedara", "quedaras", "quedara", "quedáramos", "quedarais", "quedaran"],
-        "Present Perfect Subjunctive": ["haya quedado", "hayas quedado", "haya quedado", "hayamos quedado", "hayáis quedado", "hayan quedado"],
-        "Past Perfect Subjunctive": ["hubiera quedado", "hubieras quedado", "hubiera quedado", "hubiéramos quedado", "hubierais quedado", "hubieran quedado"]
-    },
-    "creer": {
-        "Present Subjunctive": ["crea", "creas", "crea", "creamos", "creáis", "crean"],
-        "Imperfect Subjunctive": ["creyera", "creyeras", "creyera", "creyéramos", "creyerais", "creyeran"],
-        "Present Perfect Subjunctive": ["haya creído", "hayas creído", "haya creído", "hayamos creído", "hayáis creído", "hayan creído"],
-        "Past Perfect Subjunctive": ["hubiera creído", "hubieras creído", "hubiera creído", "hubiéramos creído", "hubierais creído", "hubieran creído"]
-    },
-    "hablar": {
-        "Present Subjunctive": ["hable", "hables", "hable", "hablemos", "habléis", "hablen"],
-        "Imperfect Subjunctive": ["hablara", "hablaras", "hablara", "habláramos", "hablarais", "hablaran"],
-        "Present Perfect Subjunctive": ["haya hablado", "hayas hablado", "haya hablado", "hayamos hablado", "hayáis hablado", "hayan hablado"],
-        "Past Perfect Subjunctive": ["hubiera hablado", "hubieras hablado", "hubiera hablado", "hubiéramos hablado", "hubierais hablado", "hubieran hablado"]
-    },
-    "llevar": {
-        "Present Subjunctive": ["lleve", "lleves", "lleve", "llevemos", "llevéis", "lleven"],
-        "Imperfect Subjunctive": ["llevara", "llevaras", "llevara", "lleváramos", "llevarais", "llevaran"],
-        "Present Perfect Subjunctive": ["haya llevado", "hayas llevado", "haya llevado", "hayamos llevado", "hayáis llevado", "hayan llevado"],
-        "Past Perfect Subjunctive": ["hubiera llevado", "hubieras llevado", "hubiera llevado", "hubiéramos llevado", "hubierais llevado", "hubieran llevado"]
-    },
-    "dejar": {
-        "Present Subjunctive": ["deje", "dejes", "deje", "dejemos", "dejéis", "dejen"],
-        "Imperfect Subjunctive": ["dejara", "dejaras", "dejara", "dejáramos", "dejarais", "dejaran"],
-        "Present Perfect Subjunctive": ["haya dejado", "hayas dejado", "haya dejado", "hayamos dejado", "hayáis dejado", "hayan dejado"],
-        "Past Perfect Subjunctive": ["hubiera dejado", "hubieras dejado", "hubiera dejado", "hubiéramos dejado", "hubierais dejado", "hubieran dejado"]
-    },
-    "soltar": {
-        "Present Subjunctive": ["suelte", "sueltes", "suelte", "soltemos", "soltéis", "suelten"],
-        "Imperfect Subjunctive": ["soltara", "soltaras", "soltara", "soltáramos", "soltarais", "soltaran"],
-        "Present Perfect Subjunctive": ["haya soltado", "hayas soltado", "haya soltado", "hayamos soltado", "hayáis soltado", "hayan soltado"],
-        "Past Perfect Subjunctive": ["hubiera soltado", "hubieras soltado", "hubiera soltado", "hubiéramos soltado", "hubierais soltado", "hubieran soltado"]
-    },
-    "seguir": {
-        "Present Subjunctive": ["siga", "sigas", "siga", "sigamos", "sigáis", "sigan"],
-        "Imperfect Subjunctive": ["siguiera", "siguieras", "siguiera", "siguiéramos", "siguierais", "siguieran"],
-        "Present Perfect Subjunctive": ["haya seguido", "hayas seguido", "haya seguido", "hayamos seguido", "hayáis seguido", "hayan seguido"],
-        "Past Perfect Subjunctive": ["hubiera seguido", "hubieras seguido", "hubiera seguido", "hubiéramos seguido", "hubierais seguido", "hubieran seguido"]
-    },
-    "encontrar": {
-        "Present Subjunctive": ["encuentre", "encuentres", "encuentre", "encontremos", "encontréis", "encuentren"],
-        "Imperfect Subjunctive": ["encontrara", "encontraras", "encontrara", "encontáramos", "encontrarais", "encontraran"],
-        "Present Perfect Subjunctive": ["haya encontrado", "hayas encontrado", "haya encontrado", "hayamos encontrado", "hayáis encontrado", "hayan encontrado"],
-        "Past Perfect Subjunctive": ["hubiera encontrado", "hubieras encontrado", "hubiera encontrado", "hubiéramos encontrado", "hubierais encontrado", "hubieran encontrado"]
-    },
-    "llamar": {
-        "Present Subjunctive": ["llame", "llames", "llame", "llamemos", "llaméis", "llamen"],
-        "Imperfect Subjunctive": ["llamara", "llamaras", "llamara", "llamáramos", "llamarais", "llamaran"],
-        "Present Perfect Subjunctive": ["haya llamado", "hayas llamado", "haya llamado", "hayamos llamado", "hayáis llamado", "hayan llamado"],
-        "Past Perfect Subjunctive": ["hubiera llamado", "hubieras llamado", "hubiera llamado", "hubiéramos llamado", "hubierais llamado", "hubieran llamado"]
-    },
-    "mirar": {
-        "Present Subjunctive": ["mire", "mires", "mire", "miremos", "miréis", "miren"],
-        "Imperfect Subjunctive": ["mirara", "miraras", "mirara", "miráramos", "mirarais", "miraran"],
-        "Present Perfect Subjunctive": ["haya mirado", "hayas mirado", "haya mirado", "hayamos mirado", "hayáis mirado", "hayan mirado"],
-        "Past Perfect Subjunctive": ["hubiera mirado", "hubieras mirado", "hubiera mirado", "hubiéramos mirado", "hubierais mirado", "hubieran mirado"]
-    },
-    "vivir": {
-        "Present Subjunctive": ["viva", "vivas", "viva", "vivamos", "viváis", "vivan"],
-        "Imperfect Subjunctive": ["viviera", "vivieras", "viviera", "viviéramos", "vivierais", "vivieran"],
-        "Present Perfect Subjunctive": ["haya vivido", "hayas vivido", "haya vivido", "hayamos vivido", "hayáis vivido", "hayan vivido"],
-        "Past Perfect Subjunctive": ["hubiera vivido", "hubieras vivido", "hubiera vivido", "hubiéramos vivido", "hubierais vivido", "hubieran vivido"]
-    },
-    "sentir": {
-        "Present Subjunctive": ["sienta", "sientas", "sienta", "sintamos", "sintáis", "sientan"],
-        "Imperfect Subjunctive": ["sintiera", "sintieras", "sintiera", "sintiéramos", "sintierais", "sintieran"],
-        "Present Perfect Subjunctive": ["haya sentido", "hayas sentido", "haya sentido", "hayamos sentido", "hayáis sentido", "hayan sentido"],
-        "Past Perfect Subjunctive": ["hubiera sentido", "hubieras sentido", "hubiera sentido", "hubiéramos sentido", "hubierais sentido", "hubieran sentido"]
-    },
-    "salir": {
-        "Present Subjunctive": ["salga", "salgas", "salga", "salgamos", "salgáis", "salgan"],
-        "Imperfect Subjunctive": ["saliera", "salieras", "saliera", "saliéramos", "salierais", "salieran"],
-        "Present Perfect Subjunctive": ["haya salido", "hayas salido", "haya salido", "hayamos salido", "hayáis salido", "hayan salido"],
-        "Past Perfect Subjunctive": ["hubiera salido", "hubieras salido", "hubiera salido", "hubiéramos salido", "hubierais salido", "hubieran salido"]
-    },
-    "volver": {
-        "Present Subjunctive": ["vuelva", "vuelvas", "vuelva", "volvamos", "volváis", "vuelvan"],
-        "Imperfect Subjunctive": ["volviera", "volvieras", "volviera", "volviéramos", "volvierais", "volvieran"],
-        "Present Perfect Subjunctive": ["haya vuelto", "hayas vuelto", "haya vuelto", "hayamos vuelto", "hayáis vuelto", "hayan vuelto"],
-        "Past Perfect Subjunctive": ["hubiera vuelto", "hubieras vuelto", "hubiera vuelto", "hubiéramos vuelto", "hubierais vuelto", "hubieran vuelto"]
-    },
-    "tomar": {
-        "Present Subjunctive": ["tome", "tomes", "tome", "tomemos", "toméis", "tomen"],
-        "Imperfect Subjunctive": ["tomara", "tomaras", "tomara", "tomáramos", "tomarais", "tomaran"],
-        "Present Perfect Subjunctive": ["haya tomado", "hayas tomado", "haya tomado", "hayamos tomado", "hayáis tomado", "hayan tomado"],
-        "Past Perfect Subjunctive": ["hubiera tomado", "hubieras tomado", "hubiera tomado", "hubiéramos tomado", "hubierais tomado", "hubieran tomado"]
-    },
-    "probar": {
-        "Present Subjunctive": ["pruebe", "pruebes", "pruebe", "probemos", "probéis", "prueben"],
-        "Imperfect Subjunctive": ["probara", "probaras", "probara", "probáramos", "probarais", "probaran"],
-        "Present Perfect Subjunctive": ["haya probado", "hayas probado", "haya probado", "hayamos probado", "hayáis probado", "hayan probado"],
-        "Past Perfect Subjunctive": ["hubiera probado", "hubieras probado", "hubiera probado", "hubiéramos probado", "hubierais probado", "hubieran probado"]
     },
+    "haber": {"Present Subjunctive": ["haya", "hayas", "haya", "hayamos", "hayáis", "hayan"]},
+    "saber": {"Present Subjunctive": ["sepa", "sepas", "sepa", "sepamos", "sepáis", "sepan"]},
+    "dar": {"Present Subjunctive": ["dé", "des", "dé", "demos", "deis", "den"]},
     "pedir": {
         "Present Subjunctive": ["pida", "pidas", "pida", "pidamos", "pidáis", "pidan"],
         "Imperfect Subjunctive": ["pidiera", "pidieras", "pidiera", "pidiéramos", "pidierais", "pidieran"],
-        "Present Perfect Subjunctive": ["haya pedido", "hayas pedido", "haya pedido", "hayamos pedido", "hayáis pedido", "hayan pedido"],
-        "Past Perfect Subjunctive": ["hubiera pedido", "hubieras pedido", "hubiera pedido", "hubiéramos pedido", "hubierais pedido", "hubieran pedido"]
-    },
-    "responder": {
-        "Present Subjunctive": ["responda", "respondas", "responda", "respondamos", "respondáis", "respondan"],
-        "Imperfect Subjunctive": ["respondiera", "respondieras", "respondiera", "respondiéramos", "respondierais", "respondieran"],
-        "Present Perfect Subjunctive": ["haya respondido", "hayas respondido", "haya respondido", "hayamos respondido", "hayáis respondido", "hayan respondido"],
-        "Past Perfect Subjunctive": ["hubiera respondido", "hubieras respondido", "hubiera respondido", "hubiéramos respondido", "hubierais respondido", "hubieran respondido"]
-    },
-    "abrir": {
-        "Present Subjunctive": ["abra", "abras", "abra", "abramos", "abráis", "abran"],
-        "Imperfect Subjunctive": ["abriera", "abrieras", "abriera", "abriéramos", "abrierais", "abrieran"],
-        "Present Perfect Subjunctive": ["haya abierto", "hayas abierto", "haya abierto", "hayamos abierto", "hayáis abierto", "hayan abierto"],
-        "Past Perfect Subjunctive": ["hubiera abierto", "hubieras abierto", "hubiera abierto", "hubiéramos abierto", "hubierais abierto", "hubieran abierto"]
-    },
-    "cerrar": {
-        "Present Subjunctive": ["cierre", "cierres", "cierre", "cerremos", "cerréis", "cierren"],
-        "Imperfect Subjunctive": ["cerrara", "cerraras", "cerrara", "cerráramos", "cerrarais", "cerraran"],
-        "Present Perfect Subjunctive": ["haya cerrado", "hayas cerrado", "haya cerrado", "hayamos cerrado", "hayáis cerrado", "hayan cerrado"],
-        "Past Perfect Subjunctive": ["hubiera cerrado", "hubieras cerrado", "hubiera cerrado", "hubiéramos cerrado", "hubierais cerrado", "hubieran cerrado"]
-    },
-    "perder": {
-        "Present Subjunctive": ["pierda", "pierdas", "pierda", "perdamos", "perdáis", "pierdan"],
-        "Imperfect Subjunctive": ["perdiera", "perdieras", "perdiera", "perdiéramos", "perdierais", "perdieran"],
-        "Present Perfect Subjunctive": ["haya perdido", "hayas perdido", "haya perdido", "hayamos perdido", "hayáis perdido", "hayan perdido"],
-        "Past Perfect Subjunctive": ["hubiera perdido", "hubieras perdido", "hubiera perdido", "hubiéramos perdido", "hubierais perdido", "hubieran perdido"]
-    },
-    "ganar": {
-        "Present Subjunctive": ["gane", "ganes", "gane", "ganemos", "ganéis", "ganen"],
-        "Imperfect Subjunctive": ["ganara", "ganaras", "ganara", "ganáramos", "ganarais", "ganaran"],
-        "Present Perfect Subjunctive": ["haya ganado", "hayas ganado", "haya ganado", "hayamos ganado", "hayáis ganado", "hayan ganado"],
-        "Past Perfect Subjunctive": ["hubiera ganado", "hubieras ganado", "hubiera ganado", "hubiéramos ganado", "hubierais ganado", "hubieran ganado"]
-    },
-    "pagar": {
-        "Present Subjunctive": ["pague", "pagues", "pague", "paguemos", "paguéis", "paguen"],
-        "Imperfect Subjunctive": ["pagara", "pagaras", "pagara", "pagáramos", "pagarais", "pagaran"],
-        "Present Perfect Subjunctive": ["haya pagado", "hayas pagado", "haya pagado", "hayamos pagado", "hayáis pagado", "hayan pagado"],
-        "Past Perfect Subjunctive": ["hubiera pagado", "hubieras pagado", "hubiera pagado", "hubiéramos pagado", "hubierais pagado", "hubieran pagado"]
-    },
-    "traer": {
-        "Present Subjunctive": ["traiga", "traigas", "traiga", "traigamos", "traigáis", "traigan"],
-        "Imperfect Subjunctive": ["trajera", "trajeras", "trajera", "trajéramos", "trajerais", "trajeran"],
-        "Present Perfect Subjunctive": ["haya traído", "hayas traído", "haya traído", "hayamos traído", "hayáis traído", "hayan traído"],
-        "Past Perfect Subjunctive": ["hubiera traído", "hubieras traído", "hubiera traído", "hubiéramos traído", "hubierais traído", "hubieran traído"]
-    },
-    "comer": {
-        "Present Subjunctive": ["coma", "comas", "coma", "comamos", "comáis", "coman"],
-        "Imperfect Subjunctive": ["comiera", "comieras", "comiera", "comiéramos", "comierais", "comieran"],
-        "Present Perfect Subjunctive": ["haya comido", "hayas comido", "haya comido", "hayamos comido", "hayáis comido", "hayan comido"],
-        "Past Perfect Subjunctive": ["hubiera comido", "hubieras comido", "hubiera comido", "hubiéramos comido", "hubierais comido", "hubieran comido"]
-    },
-    "dormir": {
-        "Present Subjunctive": ["duerma", "duermas", "duerma", "durmamos", "durmáis", "duerman"],
-        "Imperfect Subjunctive": ["durmiera", "durmieras", "durmiera", "durmiéramos", "durmierais", "durmieran"],
-        "Present Perfect Subjunctive": ["haya dormido", "hayas dormido", "haya dormido", "hayamos dormido", "hayáis dormido", "hayan dormido"],
-        "Past Perfect Subjunctive": ["hubiera dormido", "hubieras dormido", "hubiera dormido", "hubiéramos dormido", "hubierais dormido", "hubieran dormido"]
-    },
-    "estudiar": {
-        "Present Subjunctive": ["estudie", "estudies", "estudie", "estudiemos", "estudiéis", "estudien"],
-        "Imperfect Subjunctive": ["estudiara", "estudiaras", "estudiara", "estudiáramos", "estudiarais", "estudiaran"],
-        "Present Perfect Subjunctive": ["haya estudiado", "hayas estudiado", "haya estudiado", "hayamos estudiado", "hayáis estudiado", "hayan estudiado"],
-        "Past Perfect Subjunctive": ["hubiera estudiado", "hubieras estudiado", "hubiera estudiado", "hubiéramos estudiado", "hubierais estudiado", "hubieran estudiado"]
-    },
-    "conducir": {
-        "Present Subjunctive": ["conduzca", "conduzcas", "conduzca", "conduzcamos", "conduzcáis", "conduzcan"],
-        "Imperfect Subjunctive": ["condujera", "condujeras", "condujera", "condujéramos", "condujerais", "condujeran"],
-        "Present Perfect Subjunctive": ["haya conducido", "hayas conducido", "haya conducido", "hayamos conducido", "hayáis conducido", "hayan conducido"],
-        "Past Perfect Subjunctive": ["hubiera conducido", "hubieras conducido", "hubiera conducido", "hubiéramos conducido", "hubierais conducido", "hubieran conducido"]
-    },
-    "comprar": {
-        "Present Subjunctive": ["compre", "compres", "compre", "compremos", "compréis", "compren"],
-        "Imperfect Subjunctive": ["comprara", "compraras", "comprara", "compráramos", "comprarais", "compraran"],
-        "Present Perfect Subjunctive": ["haya comprado", "hayas comprado", "haya comprado", "hayamos comprado", "hayáis comprado", "hayan comprado"],
-        "Past Perfect Subjunctive": ["hubiera comprado", "hubieras comprado", "hubiera comprado", "hubiéramos comprado", "hubierais comprado", "hubieran comprado"]
-    },
-    "vender": {
-        "Present Subjunctive": ["venda", "vendas", "venda", "vendamos", "vendáis", "vendan"],
-        "Imperfect Subjunctive": ["vendiera", "vendieras", "vendiera", "vendiéramos", "vendierais", "vendieran"],
-        "Present Perfect Subjunctive": ["haya vendido", "hayas vendido", "haya vendido", "hayamos vendido", "hayáis vendido", "hayan vendido"],
-        "Past Perfect Subjunctive": ["hubiera vendido", "hubieras vendido", "hubiera vendido", "hubiéramos vendido", "hubierais vendido", "hubieran vendido"]
     },
 }
 
+VERBS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slt_verbs.js')
+
+SUBJUNCTIVE_TENSES = (
+    'Present Subjunctive',
+    'Imperfect Subjunctive',
+    'Present Perfect Subjunctive',
+    'Past Perfect Subjunctive',
+)
+
+# Suffix tables per ending class; -er and -ir share the same subjunctive endings
+PRESENT_SUBJUNCTIVE_SUFFIXES = {
+    'ar': ('e', 'es', 'e', 'emos', 'éis', 'en'),
+    'er': ('a', 'as', 'a', 'amos', 'áis', 'an'),
+    'ir': ('a', 'as', 'a', 'amos', 'áis', 'an'),
+}
+# Imperfect subjunctive suffixes, keyed by the preterite ellos ending they replace
+IMPERFECT_SUBJUNCTIVE_SUFFIXES = {
+    'aron': ('ara', 'aras', 'ara', 'áramos', 'arais', 'aran'),
+    'ieron': ('iera', 'ieras', 'iera', 'iéramos', 'ierais', 'ieran'),
+    'eron': ('era', 'eras', 'era', 'éramos', 'erais', 'eran'),
+}
+
+# Auxiliary forms of haber used by the compound subjunctive tenses
+HAYA = ('haya', 'hayas', 'haya', 'hayamos', 'hayáis', 'hayan')
+HUBIERA = ('hubiera', 'hubieras', 'hubiera', 'hubiéramos', 'hubierais', 'hubieran')
+
+# Every compound tense in the catalog is one of these auxiliaries + the past participle
+COMPOUND_AUXILIARIES = {
+    'Present Perfect': ('he', 'has', 'ha', 'hemos', 'habéis', 'han'),
+    'Past Perfect': ('había', 'habías', 'había', 'habíamos', 'habíais', 'habían'),
+    'Future Perfect': ('habré', 'habrás', 'habrá', 'habremos', 'habréis', 'habrán'),
+    'Conditional Perfect': ('habría', 'habrías', 'habría', 'habríamos', 'habríais', 'habrían'),
+    'Present Perfect Subjunctive': HAYA,
+    'Past Perfect Subjunctive': HUBIERA,
+}
+
+REFLEXIVE_PRONOUNS = ('me', 'te', 'se', 'nos', 'os', 'se')
+
+# Stem changes as (infinitive vowel, yo-stem vowel), most specific first;
+# adquirir -> adquiero, oler -> huelo
+STEM_CHANGES = (
+    ('e', 'ie'), ('i', 'ie'), ('o', 'ue'), ('o', 'hue'), ('u', 'ue'), ('e', 'i'), ('e', 'í'), ('i', 'í'), ('u', 'ú'),
+)
+# Vowel used by the nosotros/vosotros forms of -ir stem-changing verbs (sintamos, durmamos);
+# other vowels keep the infinitive's (adquiramos)
+IR_RAISED_VOWELS = {'e': 'i', 'o': 'u'}
+
+# Strong preterite stems for verbs without a stored Preterite (tener -> tuv + iera)
+STRONG_PRETERITE_STEMS = {
+    'andar': 'anduv', 'caber': 'cup', 'dar': 'd', 'decir': 'dij', 'estar': 'estuv', 'haber': 'hub',
+    'hacer': 'hic', 'poder': 'pud', 'poner': 'pus', 'querer': 'quis', 'saber': 'sup', 'tener': 'tuv',
+    'traer': 'traj', 'venir': 'vin',
+}
+# Endings whose compounds share the strong stem (mantener, componer, conducir, satisfacer)
+STRONG_PRETERITE_ENDINGS = {
+    'tener': 'tuv', 'poner': 'pus', 'hacer': 'hic', 'facer': 'fic', 'venir': 'vin', 'decir': 'dij',
+    'traer': 'traj', 'ducir': 'duj',
+}
+
+# Participles that do not follow -ado/-ido, for verbs without a stored Present Perfect
+IRREGULAR_PARTICIPLES = {
+    'abrir': 'abierto', 'cubrir': 'cubierto', 'decir': 'dicho', 'escribir': 'escrito',
+    'hacer': 'hecho', 'morir': 'muerto', 'poner': 'puesto', 'resolver': 'resuelto',
+    'romper': 'roto', 'ver': 'visto', 'volver': 'vuelto', 'devolver': 'devuelto',
+}
+
+
+def load_verbs(path=VERBS_PATH):
+    """
+    Parse the `verbs` array exported by slt_verbs.js into a list of dicts.
+    The file is a JS object literal, so bare keys are quoted and trailing
+    commas dropped before handing it to the JSON parser.
+    """
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    body = source[source.index('['):source.rindex(']') + 1]
+    body = re.sub(r'^(\s*)([A-Za-z_]\w*)\s*:', r'\1"\2":', body, flags=re.M)
+    body = re.sub(r',(\s*[}\]])', r'\1', body)
+    return json.loads(body)
+
+
+@memoized()
+def split_infinitive(spanish_verb):
+    """
+    Split a catalog infinitive into (core verb, is_reflexive, trailing words).
+    e.g. "ducharse" -> ("duchar", True, ""), "pedir prestado" -> ("pedir", False, "prestado")
+    """
+    core, _, tail = spanish_verb.partition(' ')
+    reflexive = core.endswith(('arse', 'erse', 'irse', 'írse'))
+    if reflexive:
+        core = core[:-2]
+    return core, reflexive, tail
+
+
+@memoized()
+def ending_class(spanish_verb):
+    """
+    Return the ending class ('ar', 'er' or 'ir') of an infinitive, or None
+    for catalog entries that are not infinitives (e.g. "yo conquisto").
+    """
+    core = split_infinitive(spanish_verb)[0]
+    if core.endswith('ír'):
+        return 'ir'
+    if core.endswith(('ar', 'er', 'ir')):
+        return core[-2:]
+    return None
+
+
+@memoized()
+def infinitive_stem(spanish_verb):
+    """
+    Infinitive minus its -ar/-er/-ir ending ("ducharse" -> "duch").
+    """
+    return split_infinitive(spanish_verb)[0][:-2]
+
+
+@memoized()
+def present_stem(spanish_verb, yo_form=None):
+    """
+    Stem of the bare present yo form ("cierro" -> "cierr", "tengo" -> "teng"),
+    falling back to the infinitive stem when yo_form does not end in -o.
+    """
+    if yo_form and yo_form.endswith('o'):
+        return yo_form[:-1]
+    return infinitive_stem(spanish_verb)
+
+
+@memoized()
+def preterite_stem(spanish_verb, preterite_ellos=None):
+    """
+    Split the bare preterite ellos form into (stem, ending), where the ending
+    is 'ieron', 'aron' or 'eron' (tuvieron -> ("tuv", "ieron")). Returns None
+    when no preterite is given or it has an unexpected ending.
+    """
+    if preterite_ellos:
+        for ending in ('ieron', 'aron', 'eron'):
+            if preterite_ellos.endswith(ending):
+                return preterite_ellos[:-len(ending)], ending
+    return None
+
+
+def _comparable_stem(stem):
+    """
+    Undo final-consonant spelling changes (sigo/seguir, elijo/elegir,
+    venzo/vencer) so a yo stem can be compared with the infinitive stem.
+    """
+    if stem.endswith('gu'):
+        return stem[:-1]
+    if stem.endswith('j'):
+        return stem[:-1] + 'g'
+    if stem.endswith('z'):
+        return stem[:-1] + 'c'
+    return stem
+
+
+@memoized()
+def stem_change(spanish_verb, yo_stem):
+    """
+    Detect the stem change between an infinitive and its present yo stem.
+    Returns (position, infinitive vowel, yo vowel) or None when the yo stem
+    is either unchanged or irregular in another way (tengo, conozco, digo).
+    """
+    core_stem = _comparable_stem(infinitive_stem(spanish_verb))
+    target = _comparable_stem(yo_stem)
+    if core_stem == target:
+        return None
+    for old, new in STEM_CHANGES:
+        position = core_stem.rfind(old)
+        while position != -1:
+            if core_stem[:position] + new + core_stem[position + len(old):] == target:
+                return position, old, new
+            position = core_stem.rfind(old, 0, position)
+    return None
+
+
+def spell_before_e(stem):
+    """
+    Keep the consonant sound of an -ar stem before an e ending
+    (pague, busque, abrace, averigüe).
+    """
+    if stem.endswith('gu'):
+        return stem[:-2] + 'gü'
+    if stem.endswith('g'):
+        return stem + 'u'
+    if stem.endswith('c'):
+        return stem[:-1] + 'qu'
+    if stem.endswith('z'):
+        return stem[:-1] + 'c'
+    return stem
+
+
+@memoized()
+def present_subjunctive_stems(spanish_verb, yo_form=None):
+    """
+    Return the (yo/tú/él/ellos stem, nosotros/vosotros stem) of the present
+    subjunctive. yo_form is the bare present yo form ("cierro", "tengo");
+    without it, or when it does not end in -o, the infinitive stem is used.
+    """
+    verb_class = ending_class(spanish_verb)
+    stem = present_stem(spanish_verb, yo_form)
+    nosotros_stem = stem
+    change = stem_change(spanish_verb, stem)
+    if change is not None:
+        position, old, new = change
+        if new in ('í', 'ú'):
+            vowel = 'i' if new == 'í' else 'u'
+        elif verb_class == 'ir':
+            vowel = IR_RAISED_VOWELS.get(old, old)
+        else:
+            vowel = old
+        nosotros_stem = stem[:position] + vowel + stem[position + len(new):]
+    if verb_class == 'ar':
+        stem, nosotros_stem = spell_before_e(stem), spell_before_e(nosotros_stem)
+    return stem, nosotros_stem
+
+
+@memoized()
+def strong_preterite_stem(spanish_verb):
+    """
+    Strong preterite stem of a verb or one of its compounds
+    ("mantener" -> "mantuv", "conducir" -> "conduj"), or None.
+    """
+    core = split_infinitive(spanish_verb)[0]
+    if core in STRONG_PRETERITE_STEMS:
+        return STRONG_PRETERITE_STEMS[core]
+    for ending, stem in STRONG_PRETERITE_ENDINGS.items():
+        if core.endswith(ending):
+            return core[:-len(ending)] + stem
+    return None
+
+
+@memoized()
+def imperfect_subjunctive_stem(spanish_verb, preterite_ellos=None, yo_form=None):
+    """
+    Return (stem, suffix key) for the imperfect subjunctive. The stem is the
+    preterite ellos form minus its ending (tuvieron -> tuv + iera); without
+    a stored preterite it is derived from the infinitive, using the present
+    yo form to spot -ir stem changes (duermo -> durmiera, sigo -> siguiera).
+    """
+    split = preterite_stem(spanish_verb, preterite_ellos)
+    if split is not None:
+        return split
+    strong = strong_preterite_stem(spanish_verb)
+    if strong is not None:
+        # dijeron, trajeron, condujeron drop the i after j
+        return strong, 'eron' if strong.endswith('j') else 'ieron'
+    verb_class = ending_class(spanish_verb)
+    core = split_infinitive(spanish_verb)[0]
+    stem = infinitive_stem(spanish_verb)
+    if verb_class == 'ar':
+        return stem, 'aron'
+    if core.endswith('eír'):
+        # reír -> rieron -> riera
+        return stem[:-1] + 'i', 'eron'
+    if stem and (stem[-1] in 'aeo' or (verb_class == 'ir' and stem.endswith('u') and not stem.endswith(('gu', 'qu')))):
+        # leer -> leyera, oír -> oyera, construir -> construyera
+        return stem + 'y', 'eron'
+    if verb_class == 'ir' and yo_form:
+        change = stem_change(spanish_verb, present_stem(spanish_verb, yo_form))
+        if change is not None:
+            # Raise the infinitive vowel, keeping its spelling (seguir -> siguiera, not sigiera)
+            position, old, _ = change
+            stem = stem[:position] + IR_RAISED_VOWELS.get(old, old) + stem[position + len(old):]
+    return stem, 'ieron'
+
+
+@memoized()
+def past_participle(spanish_verb, stored=None):
+    """
+    Return the past participle; stored is the participle read off the
+    catalog and wins over the rules.
+    """
+    if stored:
+        return stored
+    core = split_infinitive(spanish_verb)[0]
+    if core in IRREGULAR_PARTICIPLES:
+        return IRREGULAR_PARTICIPLES[core]
+    stem = infinitive_stem(spanish_verb)
+    if ending_class(spanish_verb) == 'ar':
+        return stem + 'ado'
+    if stem and stem[-1] in 'aeo':
+        return stem + 'ído'
+    return stem + 'ido'
+
+
+def bare_form(form, reflexive, tail):
+    """
+    Strip the reflexive pronoun and trailing phrase words from a stored form.
+    """
+    words = form.split(' ')
+    if reflexive:
+        words = words[1:]
+    if tail:
+        words = words[:len(words) - len(tail.split(' '))]
+    return ' '.join(words)
+
+
+def decorate_forms(forms, reflexive, tail):
+    """
+    Put the reflexive pronouns and trailing phrase words back on generated forms.
+    """
+    if reflexive:
+        forms = [pronoun + ' ' + form for pronoun, form in zip(REFLEXIVE_PRONOUNS, forms)]
+    if tail:
+        forms = [form + ' ' + tail for form in forms]
+    return forms
+
+
+def stored_participle(conjugations, reflexive, tail):
+    """
+    Read the past participle off the stored Present Perfect ("he hablado").
+    """
+    perfect = conjugations.get('Present Perfect')
+    if perfect and len(perfect) == 6:
+        words = bare_form(perfect[0], reflexive, tail).split(' ')
+        if len(words) == 2:
+            return words[1]
+    return None
+
+
+def _stored_form(conjugations, tense, person, reflexive, tail):
+    forms = conjugations.get(tense)
+    if forms and len(forms) == 6:
+        return bare_form(forms[person], reflexive, tail)
+    return None
+
+
+def _verb_row(spanish_verb, conjugations):
+    """
+    Derive everything the suffix tables need for one verb:
+    (present class, boot stem, nosotros stem, imperfect stem, imperfect key, participle).
+    """
+    core, reflexive, tail = split_infinitive(spanish_verb)
+    yo_form = _stored_form(conjugations, 'Present', 0, reflexive, tail)
+    preterite_ellos = _stored_form(conjugations, 'Preterite', 5, reflexive, tail)
+    stem, nosotros_stem = present_subjunctive_stems(core, yo_form)
+    imperfect_stem, imperfect_key = imperfect_subjunctive_stem(core, preterite_ellos, yo_form)
+    participle = past_participle(core, stored_participle(conjugations, reflexive, tail))
+    return ending_class(core), stem, nosotros_stem, imperfect_stem, imperfect_key, participle
+
+
+def _apply_overrides(spanish_verb, tenses, overrides):
+    core, reflexive, tail = split_infinitive(spanish_verb)
+    for tense, forms in overrides.get(core, {}).items():
+        tenses[tense] = decorate_forms(list(forms), reflexive, tail)
+    return tenses
+
+
+def conjugate_subjunctive(spanish_verb, conjugations=None, overrides=SUBJUNCTIVE_CONJUGATIONS):
+    """
+    Generate the four subjunctive tenses for one verb.
+    spanish_verb: catalog infinitive (e.g. "hablar", "ducharse", "pedir prestado")
+    conjugations: the verb's stored indicative paradigms, if any
+    """
+    return generate_subjunctive_batch(
+        [{'spanish': spanish_verb, 'conjugations': conjugations or {}}], overrides
+    ).get(spanish_verb)
+
+
 def get_regular_subjunctive(spanish_verb, present_tense):
     """
     Generate subjunctive forms for regular verbs based on verb stem and type.
     spanish_verb: infinitive form (e.g., "hablar", "comer", "vivir")
     present_tense: list of present indicative conjugations
     """
-    
-    # Get the stem from the present yo form
-    stem = present_tense[0].rstrip('o')
-    
-    # Determine verb type from infinitive ending
-    if spanish_verb.endswith('ar'):
-        # -ar verbs
-        subj_present = [stem + 'e', stem + 'es', stem + 'e', stem + 'emos', stem + 'éis', stem + 'en']
-        subj_imperfect = [stem + 'ara', stem + 'aras', stem + 'ara', stem + 'áramos', stem + 'arais', stem + 'aran']
-    elif spanish_verb.endswith('er'):
-        # -er verbs
-        subj_present = [stem + 'a', stem + 'as', stem + 'a', stem + 'amos', stem + 'áis', stem + 'an']
-        subj_imperfect = [stem + 'iera', stem + 'ieras', stem + 'iera', stem + 'iéramos', stem + 'ierais', stem + 'ieran']
-    else:  # -ir verbs
-        # -ir verbs
-        subj_present = [stem + 'a', stem + 'as', stem + 'a', stem + 'amos', stem + 'áis', stem + 'an']
-        subj_imperfect = [stem + 'iera', stem + 'ieras', stem + 'iera', stem + 'iéramos', stem + 'ierais', stem + 'ieran']
-    
-    # For perfect subjunctive, use auxiliary haya
-    subj_perfect = ['haya ' + past_participle for past_participle in present_tense]  # Placeholder
-    subj_pluperfect = ['hubiera ' + past_participle for past_participle in present_tense]  # Placeholder
-    
-    return {
-        'Present Subjunctive': subj_present,
-        'Imperfect Subjunctive': subj_imperfect,
-        'Present Perfect Subjunctive': subj_perfect,
-        'Past Perfect Subjunctive': subj_pluperfect
-    }
-
-print("Subjunctive conjugation mappings ready!")
-print(f"Number of irregular verbs mapped: {len(SUBJUNCTIVE_CONJUGATIONS)}")
+    return conjugate_subjunctive(spanish_verb, {'Present': list(present_tense)})
+
+
+def generate_subjunctive_batch(verbs, overrides=SUBJUNCTIVE_CONJUGATIONS):
+    """
+    Generate all four subjunctive tenses for a whole verb list in one pass.
+    verbs: list of verb dicts as returned by load_verbs()
+    overrides: hand-written forms for suppletive verbs, applied over the rules
+    Returns a dict of infinitive -> {tense: [6 forms]}.
+
+    Verbs are grouped by ending class first so each class is built as a single
+    stem x suffix table instead of branching per verb.
+    """
+    results = {}
+    groups = {}
+    seen = set()
+    profiler = profiling.active()
+    with profiling.stage('stems'):
+        for verb in verbs:
+            spanish_verb = verb['spanish']
+            if spanish_verb in seen:
+                continue
+            seen.add(spanish_verb)
+            if ending_class(spanish_verb) is None:
+                continue
+            if profiler is None:
+                row = _verb_row(spanish_verb, verb['conjugations'])
+            else:
+                with profiler.verb(spanish_verb, 'stems'):
+                    row = _verb_row(spanish_verb, verb['conjugations'])
+            groups.setdefault((row[0], row[4]), []).append((spanish_verb,) + row[1:4] + row[5:])
+
+    with profiling.stage('generate'):
+        for (verb_class, imperfect_key), members in groups.items():
+            present_suffixes = PRESENT_SUBJUNCTIVE_SUFFIXES[verb_class]
+            imperfect_suffixes = IMPERFECT_SUBJUNCTIVE_SUFFIXES[imperfect_key]
+            present_table = [
+                [(nosotros_stem if person in (3, 4) else stem) + suffix for person, suffix in enumerate(present_suffixes)]
+                for _, stem, nosotros_stem, _, _ in members
+            ]
+            imperfect_table = [[stem + suffix for suffix in imperfect_suffixes] for _, _, _, stem, _ in members]
+            perfect_table = [[aux + ' ' + participle for aux in HAYA] for _, _, _, _, participle in members]
+            pluperfect_table = [[aux + ' ' + participle for aux in HUBIERA] for _, _, _, _, participle in members]
+            for row, (spanish_verb, _, _, _, _) in enumerate(members):
+                _, reflexive, tail = split_infinitive(spanish_verb)
+                results[spanish_verb] = _apply_overrides(spanish_verb, {
+                    'Present Subjunctive': decorate_forms(present_table[row], reflexive, tail),
+                    'Imperfect Subjunctive': decorate_forms(imperfect_table[row], reflexive, tail),
+                    'Present Perfect Subjunctive': decorate_forms(perfect_table[row], reflexive, tail),
+                    'Past Perfect Subjunctive': decorate_forms(pluperfect_table[row], reflexive, tail),
+                }, overrides)
+    return results
+
+
+# Morphology steps counted per call when profiling is on (see profiling.instrument)
+PROFILED_FUNCTIONS = (
+    'split_infinitive', 'ending_class', 'present_stem', 'preterite_stem', 'stem_change',
+    'present_subjunctive_stems', 'imperfect_subjunctive_stem', 'past_participle', 'decorate_forms', '_verb_row',
+)
+profiling.instrument(globals(), PROFILED_FUNCTIONS)
+
+
+def enable_profiling():
+    """
+    Turn profiling on and count calls to the morphology steps.
+    """
+    profiler = profiling.enable()
+    profiling.instrument(globals(), PROFILED_FUNCTIONS)
+    return profiler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--batch', action='store_true',
+                        help='generate subjunctive tenses for every verb in the catalog')
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--no-store', action='store_true',
+                        help='parse slt_verbs.js directly instead of using the compiled verb store')
+    parser.add_argument('--output', help='write the batch result as JSON to this file (default: stdout)')
+    parser.add_argument('--cache-size', type=int, help='entries kept per morphology cache (0 disables caching)')
+    parser.add_argument('--cache-stats', action='store_true',
+                        help='print morphology cache hit/miss/eviction counters to stderr')
+    parser.add_argument('--profile', metavar='PATH',
+                        help=f'write per-stage timings and a trace-event profile to PATH (or set {profiling.PROFILE_ENV})')
+    args = parser.parse_args(argv)
+    if args.cache_size is not None:
+        configure(args.cache_size)
+    if args.profile:
+        enable_profiling()
+
+    if not args.batch:
+        print("Subjunctive conjugation mappings ready!")
+        print(f"Number of suppletive verbs overridden: {len(SUBJUNCTIVE_CONJUGATIONS)}")
+        return 0
+
+    with profiling.stage('parse'):
+        if args.no_store:
+            verbs = load_verbs(args.verbs)
+        else:
+            from verb_store import load_catalog
+            verbs = load_catalog(args.verbs)
+    start = time.perf_counter()
+    results = generate_subjunctive_batch(verbs)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    with profiling.stage('emit'):
+        payload = json.dumps(results, ensure_ascii=False, indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(payload + '\n')
+        else:
+            print(payload)
+    print(f"Generated subjunctive forms for {len(results)} verbs in {elapsed_ms:.1f} ms", file=sys.stderr)
+    if args.cache_stats:
+        print(json.dumps(cache_stats(), indent=2), file=sys.stderr)
+    if args.profile:
+        profiling.write_report(args.profile)
+        print(f"Wrote profile to {args.profile}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
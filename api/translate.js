@@ -24,6 +24,30 @@ try {
   languageAliases = {};
 }
 
+// Cache, batching and verb catalog shared with the other translate function (repo root)
+let shared;
+try {
+  shared = require(path.join(__dirname, '..', 'translate_shared.js'));
+} catch (e) {
+  shared = require(path.join(__dirname, 'translate_shared.js'));
+}
+const { verbCatalog, CACHE_MAX_ENTRIES, CACHE_TTL_MS, TTLCache, MicroBatcher, normalizeText, lookupCatalog } = shared;
+
+const translateCache = new TTLCache(CACHE_MAX_ENTRIES, CACHE_TTL_MS);
+const counters = { catalogHits: 0, upstreamCalls: 0 };
+// Upstream batch size; the window and TRANSLATE_COALESCE switch live in translate_shared.js
+const BATCH_MAX_ITEMS = parseInt(process.env.TRANSLATE_BATCH_MAX_ITEMS || '50', 10); // DeepL accepts up to 50 texts per request
+
+function cacheStats() {
+  return {
+    translate: translateCache.stats(),
+    catalogHits: counters.catalogHits,
+    upstreamCalls: counters.upstreamCalls,
+    batching: { translate: translateBatcher.stats() },
+    catalogLoaded: !!verbCatalog
+  };
+}
+
 const canonicalToCode = {
   english: 'en',
   spanish: 'es',
@@ -116,10 +140,11 @@ function resolveLanguageName(name) {
   return null;
 }
 
-async function callDeepLTranslate(q, target, source) {
+// Translate several texts for one language pair; returns one translation per text
+async function callDeepLTranslate(qs, target, source) {
   const url = DEEPL_URL;
   const payload = {
-    text: [String(q)],
+    text: qs.map(String),
     target_lang: target.toUpperCase()
   };
   // Only pass source_lang if it's explicitly provided (DeepL auto-detects otherwise)
@@ -127,6 +152,7 @@ async function callDeepLTranslate(q, target, source) {
     payload.source_lang = source.toUpperCase();
   }
 
+  counters.upstreamCalls++;
   const apiRes = await fetch(url, {
     method: 'POST',
     headers: {
@@ -152,18 +178,39 @@ async function callDeepLTranslate(q, target, source) {
 
   const json = await apiRes.json();
 
-  if (json && json.translations && json.translations[0]) {
-    return { translatedText: json.translations[0].text };
+  if (json && json.translations && json.translations.length === qs.length) {
+    return json.translations.map(t => ({ translatedText: t.text }));
   }
   const err = new Error('Invalid response from DeepL');
   err.raw = json;
   throw err;
 }
 
+const translateBatcher = new MicroBatcher(callDeepLTranslate, BATCH_MAX_ITEMS);
+
+// Translate with the cache in front; misses try the local verb catalog before DeepL
+async function cachedTranslate(q, target, source) {
+  const key = `${source || 'auto'}|${target}|${normalizeText(q)}`;
+  const cached = translateCache.get(key);
+  if (cached) return cached;
+  const local = lookupCatalog(q, source, target);
+  if (local) {
+    counters.catalogHits++;
+    return { translatedText: local };
+  }
+  const translated = await translateBatcher.request(key, `${source || 'auto'}|${target}`, [target, source], q);
+  translateCache.set(key, translated);
+  return translated;
+}
+
 module.exports = async function handler(req, res) {
   console.log('translate handler invoked');
   try {
     console.log('Incoming request method:', req.method);
+    // GET ?stats=1 reports the cache counters of this warm instance
+    if (req.method === 'GET' && req.query && req.query.stats) {
+      return res.status(200).json(cacheStats());
+    }
     if (req.method !== 'POST') {
       return res.status(405).json({ error: 'Method not allowed' });
     }
@@ -254,7 +301,7 @@ module.exports = async function handler(req, res) {
           // Only call DeepL if we have a valid source code to translate FROM
           // If sourceCode is not available or null, fall through to fallback
           if (sourceCode && sourceCode !== extractedTargetCode) {
-            const translated = await callDeepLTranslate(phraseToTranslate || text, extractedTargetCode, sourceCode);
+            const translated = await cachedTranslate(phraseToTranslate || text, extractedTargetCode, sourceCode);
             // Return only the translated phrase as the direct answer and include detected/source info
             return res.status(200).json({ result: translated.translatedText, detectedSource: detectedSource, targetUsed: extractedTargetCode });
           }
@@ -269,7 +316,7 @@ module.exports = async function handler(req, res) {
     // Fallback: translate from source to target language using user's preference
     try {
       console.log('Calling DeepL for fallback', { text: text.slice(0,200), targetCode, sourceCode });
-      const translated = await callDeepLTranslate(text, targetCode, sourceCode);
+      const translated = await cachedTranslate(text, targetCode, sourceCode);
       return res.status(200).json({ result: translated.translatedText, detectedSource: detectedSource, targetUsed: targetCode });
     } catch (err) {
       return res.status(502).json({ error: 'Translation provider error', details: err.details || String(err) });
@@ -281,3 +328,5 @@ module.exports = async function handler(req, res) {
     return res.status(500).json({ error: 'Server error', details: errorDetails });
   }
 }
+
+module.exports.cacheStats = cacheStats;
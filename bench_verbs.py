@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the verb tooling.
+Builds fixed synthetic catalogs (300, 3,000 and 30,000 verbs by default) in the
+slt_verbs.js format and times parsing and loading them, subjunctive generation,
+reverse lookup of typed forms and the streaming patch/write pass. Results are
+written as JSON and can be compared against a stored baseline. Timings are
+only compared for catalogs with the same hash, and a baseline recorded on
+another machine only produces a warning unless --strict is given.
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from add_subjunctive_helper import COMPOUND_AUXILIARIES, generate_subjunctive_batch, get_regular_subjunctive, load_verbs
+from morph_cache import clear_caches
+from patch_verbs import patch_file
+from reverse_index import TENSES, build_index, lookup
+from verb_store import compile_store, load_catalog
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_baseline.json')
+
+SIZES = (300, 3000, 30000)
+QUERIES = 2000
+
+CONSONANTS = 'bcdflmnprstv'
+VOWELS = 'aeiou'
+FINALS = 'lmnrst'
+
+SIMPLE_ENDINGS = {
+    'ar': {
+        'Present': ('o', 'as', 'a', 'amos', 'áis', 'an'),
+        'Preterite': ('é', 'aste', 'ó', 'amos', 'asteis', 'aron'),
+        'Imperfect': ('aba', 'abas', 'aba', 'ábamos', 'abais', 'aban'),
+    },
+    'er': {
+        'Present': ('o', 'es', 'e', 'emos', 'éis', 'en'),
+        'Preterite': ('í', 'iste', 'ió', 'imos', 'isteis', 'ieron'),
+        'Imperfect': ('ía', 'ías', 'ía', 'íamos', 'íais', 'ían'),
+    },
+    'ir': {
+        'Present': ('o', 'es', 'e', 'imos', 'ís', 'en'),
+        'Preterite': ('í', 'iste', 'ió', 'imos', 'isteis', 'ieron'),
+        'Imperfect': ('ía', 'ías', 'ía', 'íamos', 'íais', 'ían'),
+    },
+}
+FUTURE_ENDINGS = ('é', 'ás', 'á', 'emos', 'éis', 'án')
+CONDITIONAL_ENDINGS = ('ía', 'ías', 'ía', 'íamos', 'íais', 'ían')
+# Persons whose stressed stem vowel diphthongizes in stem-changing verbs
+BOOT_PERSONS = (0, 1, 2, 5)
+
+
+def synthetic_infinitive(index):
+    """
+    The index-th synthetic infinitive: consonant-vowel-consonant-vowel-final
+    stem plus -ar/-er/-ir, spread over the space so neighbours differ.
+    """
+    space = (len(CONSONANTS) * len(VOWELS)) ** 2 * len(FINALS) * 3
+    n = index * 7919 % space
+    n, ending = divmod(n, 3)
+    n, final = divmod(n, len(FINALS))
+    n, v2 = divmod(n, len(VOWELS))
+    n, c2 = divmod(n, len(CONSONANTS))
+    c1, v1 = divmod(n, len(VOWELS))
+    stem = CONSONANTS[c1] + VOWELS[v1] + CONSONANTS[c2] + VOWELS[v2] + FINALS[final]
+    return stem + ('ar', 'er', 'ir')[ending]
+
+
+def synthetic_verb(index):
+    """
+    A catalog entry for synthetic_infinitive(index) with the nine indicative
+    tenses slt_verbs.js stores. Every fifth verb with an `e` in its last stem
+    syllable is e -> ie stem-changing, so the generator's rules get exercised.
+    """
+    infinitive = synthetic_infinitive(index)
+    stem, ending = infinitive[:-2], infinitive[-2:]
+    stem_changing = index % 5 == 0 and stem[-2] == 'e'
+    conjugations = {}
+    for tense, endings in SIMPLE_ENDINGS[ending].items():
+        forms = []
+        for person, suffix in enumerate(endings):
+            if stem_changing and tense == 'Present' and person in BOOT_PERSONS:
+                forms.append(stem[:-2] + 'ie' + stem[-1] + suffix)
+            else:
+                forms.append(stem + suffix)
+        conjugations[tense] = forms
+    conjugations['Future'] = [infinitive + suffix for suffix in FUTURE_ENDINGS]
+    conjugations['Conditional'] = [infinitive + suffix for suffix in CONDITIONAL_ENDINGS]
+    participle = stem + ('ado' if ending == 'ar' else 'ido')
+    for tense, auxiliaries in COMPOUND_AUXILIARIES.items():
+        if tense in TENSES[5:9]:
+            conjugations[tense] = [aux + ' ' + participle for aux in auxiliaries]
+    return {
+        'english': [f'to {infinitive} (synthetic)'],
+        'spanish': infinitive,
+        'type': 'stem-changing' if stem_changing else 'regular',
+        'memoryTip': 'Synthetic benchmark verb.',
+        'conjugations': conjugations,
+    }
+
+
+def write_synthetic_catalog(path, size):
+    """
+    Write a size-verb catalog to path in the slt_verbs.js layout.
+    Returns the SHA-256 of the file, which is the same on every run.
+    """
+    lines = ['export const verbs = [']
+    for index in range(size):
+        verb = synthetic_verb(index)
+        lines.append('  {')
+        for key in ('english', 'spanish', 'type', 'memoryTip'):
+            lines.append(f'    {key}: {json.dumps(verb[key], ensure_ascii=False)},')
+        lines.append('    conjugations: {')
+        tense_lines = [f'      "{tense}": {json.dumps(forms, ensure_ascii=False)}'
+                       for tense, forms in verb['conjugations'].items()]
+        lines.append(',\n'.join(tense_lines))
+        lines.append('    }')
+        lines.append('  },' if index < size - 1 else '  }')
+    lines.append('];')
+    data = ('\n'.join(lines) + '\n').encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def lookup_queries(verbs, subjunctive, count=QUERIES):
+    """
+    A fixed mix of typed forms to resolve: stored simple and compound forms,
+    generated subjunctive forms and misses, in the proportions 6:2:1:1.
+    """
+    queries = []
+    for k in range(count):
+        verb = verbs[k * 7919 % len(verbs)]
+        kind = k % 10
+        if kind == 9:
+            queries.append(f'{verb["spanish"]}xyz')
+        elif kind == 8:
+            forms = subjunctive.get(verb['spanish'], {}).get('Present Subjunctive') or verb['conjugations']['Present']
+            queries.append(forms[k % 6])
+        else:
+            tense = TENSES[k % 9 if kind >= 6 else k % 5]
+            queries.append(verb['conjugations'][tense][k % 6])
+    return queries
+
+
+def _measure(run, repeat, setup=None):
+    """
+    Time run() repeat times, calling setup() untimed before each run.
+    The garbage collector is paused while timing, as timeit does.
+    Returns ({minMs, medianMs}, result of the last run).
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        result = None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = run()
+            timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+    return {'minMs': round(min(timings), 3), 'medianMs': round(statistics.median(timings), 3)}, result
+
+
+def bench_size(size, work_dir, repeat):
+    """
+    Run every stage against one synthetic catalog size.
+    Returns the per-size result dict.
+    """
+    verbs_path = os.path.join(work_dir, f'verbs_{size}.js')
+    store_path = os.path.join(work_dir, f'verbs_{size}.bin')
+    patch_path = os.path.join(work_dir, f'patched_{size}.js')
+    state_path = os.path.join(work_dir, f'patched_{size}.patch.json')
+    digest = write_synthetic_catalog(verbs_path, size)
+    stages = {}
+
+    stages['parse'], verbs = _measure(lambda: load_verbs(verbs_path), repeat)
+    stages['storeCompile'], _ = _measure(lambda: compile_store(verbs_path, store_path, verbs=verbs), repeat)
+    stages['storeLoad'], _ = _measure(lambda: load_catalog(verbs_path, store_path), repeat)
+
+    # Generation runs with cold morphology caches, as a fresh CLI run would
+    stages['generateBatch'], subjunctive = _measure(
+        lambda: generate_subjunctive_batch(verbs), repeat, setup=clear_caches)
+    stages['generateSingle'], _ = _measure(
+        lambda: [get_regular_subjunctive(verb['spanish'], verb['conjugations']['Present']) for verb in verbs],
+        repeat, setup=clear_caches)
+
+    stages['indexBuild'], index = _measure(lambda: build_index(verbs, subjunctive), repeat)
+    queries = lookup_queries(verbs, subjunctive)
+    stages['lookup'], _ = _measure(lambda: [lookup(index, query) for query in queries], repeat)
+    stages['lookup']['queries'] = len(queries)
+
+    def fresh_copy():
+        shutil.copyfile(verbs_path, patch_path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        clear_caches()
+
+    stages['patchCold'], counts = _measure(lambda: patch_file(patch_path, state_path), repeat, setup=fresh_copy)
+    stages['patchWarm'], _ = _measure(lambda: patch_file(patch_path, state_path), repeat)
+    return {
+        'verbs': size,
+        'catalogBytes': os.path.getsize(verbs_path),
+        'catalogSha256': digest,
+        'patchedVerbs': counts['patched'],
+        'stages': stages,
+    }
+
+
+def run(sizes=SIZES, repeat=5):
+    results = {}
+    work_dir = tempfile.mkdtemp(prefix='slt_bench_')
+    try:
+        for size in sizes:
+            results[str(size)] = bench_size(size, work_dir, repeat)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        'version': 1,
+        'repeat': repeat,
+        'environment': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'node': platform.node(),
+            'cpus': os.cpu_count(),
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold, min_delta_ms):
+    """
+    Stage timings that got slower than the baseline by more than threshold
+    (a fraction) and more than min_delta_ms. Sizes or stages missing from
+    either side, and sizes whose catalog hash differs, are ignored.
+    Returns a list of (size, stage, baseline ms, current ms).
+    """
+    regressions = []
+    for size, result in current['results'].items():
+        base = baseline['results'].get(size)
+        if base is None or base.get('catalogSha256') != result['catalogSha256']:
+            continue
+        for stage, timing in result['stages'].items():
+            if stage not in base['stages']:
+                continue
+            before, after = base['stages'][stage]['minMs'], timing['minMs']
+            if after > before * (1 + threshold) and after - before > min_delta_ms:
+                regressions.append((size, stage, before, after))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='catalog sizes to benchmark')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per stage; the fastest one is compared')
+    parser.add_argument('--output', help='write the results JSON to this file (default: stdout)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown per stage as a fraction of the baseline (default 0.25)')
+    parser.add_argument('--min-delta-ms', type=float, default=5.0,
+                        help='ignore slowdowns smaller than this many milliseconds (default 5.0)')
+    parser.add_argument('--save-baseline', action='store_true', help='store these results as the new baseline')
+    parser.add_argument('--strict', action='store_true',
+                        help='fail on slowdowns even when the baseline comes from a different machine')
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat)
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload + '\n')
+    else:
+        print(payload)
+
+    for size, result in results['results'].items():
+        print(f"{size} verbs: " + ', '.join(f"{stage} {timing['minMs']:.1f} ms"
+                                             for stage, timing in result['stages'].items()), file=sys.stderr)
+
+    if args.save_baseline:
+        tmp_path = args.baseline + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload + '\n')
+        os.replace(tmp_path, args.baseline)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one", file=sys.stderr)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    for size, result in results['results'].items():
+        base = baseline['results'].get(size)
+        if base is not None and base.get('catalogSha256') != result['catalogSha256']:
+            print(f"WARNING {size} verbs: synthetic catalog differs from the baseline's; not compared", file=sys.stderr)
+    same_machine = baseline.get('environment') == results['environment']
+    if not same_machine:
+        print(f"WARNING baseline from a different machine ({baseline.get('environment')}); timings are not "
+              f"comparable. Run with --save-baseline on this machine for a meaningful check.", file=sys.stderr)
+    label = 'REGRESSION' if same_machine or args.strict else 'slower'
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    for size, stage, before, after in regressions:
+        print(f"{label} {size} verbs {stage}: {before:.1f} ms -> {after:.1f} ms "
+              f"(+{(after / before - 1) * 100:.0f}%)", file=sys.stderr)
+    if regressions and (same_machine or args.strict):
+        return 1
+    if regressions:
+        return 0
+    print(f"No stage slower than the baseline by more than {args.threshold:.0%}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+English phrase index: English gloss -> (verb, meaning, tense, person).
+Builds slt_english_index.json, which slt_script.js loads once so English
+practice mode can resolve a typed phrase ("he has eaten") with a dictionary
+probe, and a partial meaning ("to wa") with a prefix-trie walk, instead of
+building the English phrase for every verb x meaning x tense x pronoun.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+from add_subjunctive_helper import VERBS_PATH, generate_subjunctive_batch
+from reverse_index import TENSES
+from verb_store import load_catalog, source_hash
+
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slt_english_index.json')
+
+# Same order as `pronouns` in slt_script.js
+PRONOUNS = ('I', 'You', 'He', 'We', 'You all', 'They')
+REFLEXIVE_PRONOUNS = ('myself', 'yourself', 'himself', 'ourselves', 'yourselves', 'themselves')
+
+# Packed entry layouts, shared with slt_script.js:
+#   phrase hit     verb * 2048 + meaning * 128 + tense * 8 + person
+#   meaning hit    verb * 16 + meaning
+MEANING_SHIFT = 16
+TENSE_SHIFT = 8
+PHRASE_VERB_SHIFT = 2048
+PHRASE_MEANING_SHIFT = 128
+
+# English past tense and past participle; same table as buildEnglishPhrase() in slt_script.js
+IRREGULARS = {
+    # Core irregular verbs
+    'to be': ('were', 'been'),  # 'was' for I/he, see english_phrase()
+    'to have': ('had', 'had'),
+    'to do': ('did', 'done'),
+    'to go': ('went', 'gone'),
+    'to come': ('came', 'come'),
+    'to take': ('took', 'taken'),
+    'to make': ('made', 'made'),
+    'to say': ('said', 'said'),
+    'to see': ('saw', 'seen'),
+    'to get': ('got', 'gotten'),
+    'to know': ('knew', 'known'),
+    'to think': ('thought', 'thought'),
+    'to become': ('became', 'become'),
+    'to begin': ('began', 'begun'),
+    'to break': ('broke', 'broken'),
+    'to bring': ('brought', 'brought'),
+    'to buy': ('bought', 'bought'),
+    'to choose': ('chose', 'chosen'),
+    'to drink': ('drank', 'drunk'),
+    'to drive': ('drove', 'driven'),
+    'to eat': ('ate', 'eaten'),
+    'to fall': ('fell', 'fallen'),
+    'to feel': ('felt', 'felt'),
+    'to find': ('found', 'found'),
+    'to fly': ('flew', 'flown'),
+    'to forget': ('forgot', 'forgotten'),
+    'to give': ('gave', 'given'),
+    'to grow': ('grew', 'grown'),
+    'to hear': ('heard', 'heard'),
+    'to hold': ('held', 'held'),
+    'to keep': ('kept', 'kept'),
+    'to leave': ('left', 'left'),
+    'to let': ('let', 'let'),
+    'to lose': ('lost', 'lost'),
+    'to mean': ('meant', 'meant'),
+    'to meet': ('met', 'met'),
+    'to pay': ('paid', 'paid'),
+    'to put': ('put', 'put'),
+    'to read': ('read', 'read'),
+    'to run': ('ran', 'run'),
+    'to sell': ('sold', 'sold'),
+    'to send': ('sent', 'sent'),
+    'to set': ('set', 'set'),
+    'to sit': ('sat', 'sat'),
+    'to sleep': ('slept', 'slept'),
+    'to speak': ('spoke', 'spoken'),
+    'to spend': ('spent', 'spent'),
+    'to stand': ('stood', 'stood'),
+    'to swim': ('swam', 'swum'),
+    'to teach': ('taught', 'taught'),
+    'to tell': ('told', 'told'),
+    'to understand': ('understood', 'understood'),
+    'to wear': ('wore', 'worn'),
+    'to win': ('won', 'won'),
+    'to write': ('wrote', 'written'),
+    'to lead': ('led', 'led'),
+    'to lend': ('lent', 'lent'),
+    'to tear': ('tore', 'torn'),
+
+    # Multi-word verbs
+    'to take off': ('took off', 'taken off'),
+    'to sit down': ('sat down', 'sat down'),
+    'to stand up': ('stood up', 'stood up'),
+    'to wake up': ('woke up', 'woken up'),
+    'to fall asleep': ('fell asleep', 'fallen asleep'),
+    'to put to sleep': ('put to sleep', 'put to sleep'),
+    'to come back': ('came back', 'come back'),
+    'to take a risk': ('took a risk', 'taken a risk'),
+    'to fall short': ('fell short', 'fallen short'),
+    'to run over': ('ran over', 'run over'),
+    'to point out': ('pointed out', 'pointed out'),
+
+    # Regular verbs with spelling changes (double consonant)
+    'to stab': ('stabbed', 'stabbed'),
+    'to plan': ('planned', 'planned'),
+    'to stop': ('stopped', 'stopped'),
+    'to admit': ('admitted', 'admitted'),
+    'to prefer': ('preferred', 'preferred'),
+    'to travel': ('traveled', 'traveled'),
+    'to control': ('controlled', 'controlled'),
+    'to refer': ('referred', 'referred'),
+    'to occur': ('occurred', 'occurred'),
+    'to permit': ('permitted', 'permitted'),
+    'to regret': ('regretted', 'regretted'),
+    'to commit': ('committed', 'committed'),
+    'to submit': ('submitted', 'submitted'),
+    'to equip': ('equipped', 'equipped'),
+    'to omit': ('omitted', 'omitted'),
+    'to worship': ('worshipped', 'worshipped'),
+    'to format': ('formatted', 'formatted'),
+    'to target': ('targeted', 'targeted'),
+
+    # New verbs added (regular forms)
+    'to deserve': ('deserved', 'deserved'),
+    'to sound': ('sounded', 'sounded'),
+    'to trip': ('tripped', 'tripped'),
+    'to stumble': ('stumbled', 'stumbled'),
+    'to signal': ('signaled', 'signaled'),
+    'to assume': ('assumed', 'assumed'),
+    'to pretend': ('pretended', 'pretended'),
+    'to convince': ('convinced', 'convinced'),
+    'to catalog': ('cataloged', 'cataloged'),
+    'to kill': ('killed', 'killed'),
+    'to train': ('trained', 'trained'),
+    'to maintain': ('maintained', 'maintained'),
+    'to order': ('ordered', 'ordered'),
+    'to torture': ('tortured', 'tortured'),
+    'to saturate': ('saturated', 'saturated'),
+    'to mortify': ('mortified', 'mortified'),
+    'to guide': ('guided', 'guided'),
+    'to heal': ('healed', 'healed'),
+    'to cure': ('cured', 'cured'),
+    'to hang': ('hung', 'hung'),
+
+    # Other regular verbs
+    'to return': ('returned', 'returned'),
+    'to detach': ('detached', 'detached'),
+    'to try': ('tried', 'tried'),
+    'to test': ('tested', 'tested'),
+    'to prove': ('proved', 'proven'),
+    'to place': ('placed', 'placed'),
+    'to position': ('positioned', 'positioned'),
+    'to reach': ('reached', 'reached'),
+    'to achieve': ('achieved', 'achieved'),
+    'to attain': ('attained', 'attained'),
+    'to straighten': ('straightened', 'straightened'),
+    'to straighten up': ('straightened up', 'straightened up'),
+    'to hinder': ('hindered', 'hindered'),
+    'to obstruct': ('obstructed', 'obstructed'),
+    'to get in the way': ('got in the way', 'gotten in the way'),
+    'to roam': ('roamed', 'roamed'),
+    'to stroll': ('strolled', 'strolled'),
+    'to discover': ('discovered', 'discovered'),
+    'to fail': ('failed', 'failed'),
+    'to falter': ('faltered', 'faltered'),
+    'to hesitate': ('hesitated', 'hesitated'),
+    'to prioritize': ('prioritized', 'prioritized'),
+    'to hit': ('hit', 'hit'),
+    'to embark': ('embarked', 'embarked'),
+    'to board': ('boarded', 'boarded'),
+    'to influence': ('influenced', 'influenced'),
+    'to affect': ('affected', 'affected'),
+    'to demand': ('demanded', 'demanded'),
+    'to require': ('required', 'required'),
+}
+
+_PARENTHETICAL = re.compile(r'\s*\(.*?\)\s*')
+_DOUBLES_FINAL = re.compile(r'([aeiou][^aeiouwxy])$')
+
+
+def _meanings(verb):
+    return verb['english'] if isinstance(verb['english'], list) else [verb['english']]
+
+
+def display_meaning(meaning):
+    """
+    The meaning as the UI shows it; buildEnglishPhrase() renames tener's gloss.
+    """
+    return 'to have (shows possession)' if meaning == 'to have (possession)' else meaning
+
+
+def _regular_past(base):
+    if _DOUBLES_FINAL.search(base):
+        return base + base[-1] + 'ed'
+    if base.endswith('e'):
+        return base + 'd'
+    return base + 'ed'
+
+
+def english_phrase(verb, tense, person, meaning_idx=0):
+    """
+    English rendering of one conjugated form, e.g. "He would have eaten".
+    Port of buildEnglishPhrase() in slt_script.js; both must stay in step.
+    """
+    pronoun = PRONOUNS[person]
+    meaning = display_meaning(_meanings(verb)[meaning_idx])
+    base = re.sub(r'^to ', '', meaning).split(',')[0].strip()
+
+    irregular_key = _PARENTHETICAL.sub('', meaning).lower()
+    if irregular_key not in IRREGULARS and meaning.lower().startswith('to ') and meaning.lower() in IRREGULARS:
+        irregular_key = meaning.lower()
+    preterite = past_participle = _regular_past(base)
+    if irregular_key in IRREGULARS:
+        preterite, past_participle = IRREGULARS[irregular_key]
+        if irregular_key == 'to be' and pronoun in ('I', 'He'):
+            preterite = 'was'
+
+    present = base
+    if meaning == 'to have (shows possession)' and tense == 'Present':
+        return f"{pronoun} {'has' if pronoun == 'He' else 'have'}"
+    if pronoun == 'He':
+        if base.endswith('y'):
+            present = base[:-1] + 'ies'
+        elif base.endswith(('o', 'ch', 's', 'sh', 'x', 'z')):
+            present = base + 'es'
+        else:
+            present = base + 's'
+
+    have = 'has' if pronoun == 'He' else 'have'
+    if verb.get('spanish', '').endswith('se') and 'risk oneself' in base:
+        reflexive = REFLEXIVE_PRONOUNS[person]
+        risk = {
+            'Preterite': 'risked', 'Imperfect': 'used to risk', 'Future': 'will risk',
+            'Conditional': 'would risk', 'Present Perfect': f'{have} risked', 'Past Perfect': 'had risked',
+            'Future Perfect': 'will have risked', 'Conditional Perfect': 'would have risked',
+        }.get(tense, 'risk')
+        return f'{pronoun} {risk} {reflexive}'
+
+    predicate = {
+        'Present': present,
+        'Preterite': preterite,
+        'Imperfect': f'used to {base}',
+        'Future': f'will {base}',
+        'Conditional': f'would {base}',
+        'Present Perfect': f'{have} {past_participle}',
+        'Past Perfect': f'had {past_participle}',
+        'Future Perfect': f'will have {past_participle}',
+        'Conditional Perfect': f'would have {past_participle}',
+    }.get(tense, base)
+    return f'{pronoun} {predicate}'
+
+
+def build_english_index(verbs, subjunctive=None):
+    """
+    Build the English phrase index for a parsed verb list.
+    verbs: catalog in slt_verbs.js order (indexes must match the JS `verbs` array)
+    subjunctive: generated subjunctive tenses per infinitive; their glosses are
+    indexed too, since the bundles serve them for every verb
+    Returns a dict with:
+    phrases: lowercased gloss -> phrase hits, in verbs x meanings x tenses x pronouns order
+    prefixes: character trie over the lowercased meanings, with and without
+    parenthetical notes; node[""] lists the meaning hits under that prefix
+    bases: meaning without "to " and anything after a comma -> meaning hits
+    """
+    if len(TENSES) > PHRASE_MEANING_SHIFT // TENSE_SHIFT:
+        raise ValueError(f'{len(TENSES)} tenses do not fit the packed phrase hits '
+                         f'(at most {PHRASE_MEANING_SHIFT // TENSE_SHIFT})')
+    if subjunctive is None:
+        subjunctive = generate_subjunctive_batch(verbs)
+    phrases = {}
+    prefixes = {}
+    bases = {}
+    for verb_index, verb in enumerate(verbs):
+        available = set(verb['conjugations']) | set(subjunctive.get(verb['spanish'], {}))
+        verb_tenses = [(tense_id, tense) for tense_id, tense in enumerate(TENSES) if tense in available]
+        for meaning_idx, meaning in enumerate(_meanings(verb)):
+            if meaning_idx >= MEANING_SHIFT:
+                raise ValueError(f"{verb['spanish']} has more than {MEANING_SHIFT} English meanings, "
+                                 f"which do not fit the packed index hits")
+            meaning_hit = verb_index * MEANING_SHIFT + meaning_idx
+            for tense_id, tense in verb_tenses:
+                for person in range(len(PRONOUNS)):
+                    key = english_phrase(verb, tense, person, meaning_idx).lower()
+                    packed = (verb_index * PHRASE_VERB_SHIFT + meaning_idx * PHRASE_MEANING_SHIFT
+                              + tense_id * TENSE_SHIFT + person)
+                    phrases.setdefault(key, []).append(packed)
+
+            # The page matches against the stored meaning until the first
+            # buildEnglishPhrase() call renames it, so index both spellings.
+            # dict.fromkeys dedupes in insertion order, keeping the trie byte-stable across runs
+            keys = {}
+            for variant in dict.fromkeys((meaning.lower(), display_meaning(meaning).lower())):
+                keys[variant] = None
+                keys[_PARENTHETICAL.sub('', variant).strip()] = None
+                base = re.sub(r'^to ', '', variant).split(',')[0].strip()
+                bases.setdefault(base, [])
+                if meaning_hit not in bases[base]:
+                    bases[base].append(meaning_hit)
+            for key in keys:
+                node = prefixes
+                for char in key:
+                    node = node.setdefault(char, {})
+                    hits = node.setdefault('', [])
+                    if meaning_hit not in hits:
+                        hits.append(meaning_hit)
+
+    return {
+        'version': 1,
+        'verbCount': len(verbs),
+        'tenses': list(TENSES),
+        'pronouns': list(PRONOUNS),
+        'phrases': phrases,
+        'prefixes': prefixes,
+        'bases': bases,
+    }
+
+
+def lookup(index, phrase):
+    """
+    Resolve a typed English phrase the way parseEnglishPhrase() does.
+    Returns ('phrase', [(verb index, meaning, tense, person), ...]) for exact
+    glosses, else ('meaning', [(verb index, meaning), ...]) for meanings that
+    start with or equal the phrase; the first entry is what the page picks.
+    """
+    key = phrase.strip().lower()
+    hits = index['phrases'].get(key)
+    if hits:
+        return 'phrase', [(packed // PHRASE_VERB_SHIFT, packed % PHRASE_VERB_SHIFT // PHRASE_MEANING_SHIFT,
+                           index['tenses'][packed % PHRASE_MEANING_SHIFT // TENSE_SHIFT], packed % TENSE_SHIFT)
+                          for packed in hits]
+    node = index['prefixes']
+    for char in key:
+        node = node.get(char)
+        if node is None:
+            break
+    found = set(node.get('', ()) if node is not None and key else ()) | set(index['bases'].get(key, ()))
+    return 'meaning', [divmod(packed, MEANING_SHIFT) for packed in sorted(found)]
+
+
+def write_english_index(verbs_path=VERBS_PATH, output_path=INDEX_PATH):
+    """
+    Build the index from slt_verbs.js and write it as compact JSON.
+    """
+    index = build_english_index(load_catalog(verbs_path))
+    index['sourceHash'] = source_hash(verbs_path).hex()
+    payload = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(payload)
+    os.replace(tmp_path, output_path)
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--index', default=INDEX_PATH, help='path to the English phrase index JSON')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='write the English phrase index')
+    find = subparsers.add_parser('lookup', help='resolve an English phrase')
+    find.add_argument('phrase')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        index = write_english_index(args.verbs, args.index)
+        print(f"Indexed {len(index['phrases'])} phrases for {index['verbCount']} verbs "
+              f"into {args.index} ({os.path.getsize(args.index)} bytes)")
+        return 0
+
+    with open(args.index, encoding='utf-8') as f:
+        index = json.load(f)
+    verbs = load_catalog(args.verbs)
+    kind, matches = lookup(index, args.phrase)
+    if not matches:
+        print(f"No verb found for {args.phrase}", file=sys.stderr)
+        return 1
+    for match in matches:
+        verb = verbs[match[0]]
+        print('\t'.join([verb['spanish'], _meanings(verb)[match[1]]] + [str(part) for part in match[2:]]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Bounded LRU caches for the morphology primitives in add_subjunctive_helper.py.
+Every cache is registered by name so its size can be tuned and its hit, miss
+and eviction counters inspected after a full-catalog run.
+"""
+
+import functools
+import os
+from collections import OrderedDict
+
+DEFAULT_SIZE = int(os.environ.get('SLT_MORPH_CACHE_SIZE', 4096))
+
+CACHES = {}
+
+
+class LRUCache:
+    """
+    Least-recently-used mapping with a fixed capacity and usage counters.
+    maxsize: number of entries kept; 0 disables caching entirely
+    """
+
+    def __init__(self, name, maxsize=DEFAULT_SIZE):
+        self.name = name
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, compute):
+        """
+        Return the cached value for key, calling compute() on a miss.
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        value = compute()
+        if self.maxsize > 0:
+            entries[key] = value
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def resize(self, maxsize):
+        self.maxsize = maxsize
+        while len(self._entries) > max(maxsize, 0):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def clear(self):
+        self._entries.clear()
+        self.reset_stats()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hitRate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def memoized(name=None, maxsize=None):
+    """
+    Decorator caching a function on its positional arguments in a named
+    LRUCache. The cache is reachable as `func.cache` and through CACHES.
+    """
+    def decorate(func):
+        key = name or func.__name__
+        # Reuse an existing cache so a module run as __main__ and imported again shares it
+        cache = CACHES.get(key)
+        if cache is None:
+            cache = CACHES[key] = LRUCache(key, DEFAULT_SIZE if maxsize is None else maxsize)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            return cache.get(args, lambda: func(*args))
+
+        wrapper.cache = cache
+        return wrapper
+    return decorate
+
+
+def configure(maxsize=None, **sizes):
+    """
+    Resize caches: maxsize applies to all of them, keyword arguments to
+    individual caches by name (e.g. configure(past_participle=256)).
+    """
+    for name, cache in CACHES.items():
+        size = sizes.get(name, maxsize)
+        if size is not None:
+            cache.resize(size)
+
+
+def cache_stats():
+    """
+    Counters for every registered cache, keyed by cache name.
+    """
+    return {name: cache.stats() for name, cache in CACHES.items()}
+
+
+def clear_caches():
+    for cache in CACHES.values():
+        cache.clear()
+
+
+def reset_stats():
+    """
+    Zero every counter but keep the cached entries.
+    """
+    for cache in CACHES.values():
+        cache.reset_stats()
+
+
+def merge_stats(snapshots):
+    """
+    Combine cache_stats() snapshots taken in separate processes.
+    """
+    merged = {}
+    for snapshot in snapshots:
+        for name, stats in snapshot.items():
+            total = merged.setdefault(name, {'hits': 0, 'misses': 0, 'evictions': 0,
+                                             'size': 0, 'maxsize': stats['maxsize']})
+            for counter in ('hits', 'misses', 'evictions'):
+                total[counter] += stats[counter]
+            total['size'] = max(total['size'], stats['size'])
+    for total in merged.values():
+        lookups = total['hits'] + total['misses']
+        total['hitRate'] = round(total['hits'] / lookups, 4) if lookups else 0.0
+    return merged
@@ -0,0 +1,144 @@
+// Benchmark for translate request coalescing - replays classroom-sized bursts
+// against a local mock Google endpoint with and without batching, and reports
+// per-request p50/p99 latency and the number of upstream calls.
+// Run with: node netlify/functions/bench_translate_batching.js [--json]
+// Tune with BENCH_ROUNDS, BENCH_CLASS_SIZE, BENCH_LATENCY_MS, TRANSLATE_BATCH_WINDOW_MS.
+
+const { fork } = require('child_process');
+const http = require('http');
+const path = require('path');
+
+const ROUNDS = parseInt(process.env.BENCH_ROUNDS || '20', 10);
+const CLASS_SIZE = parseInt(process.env.BENCH_CLASS_SIZE || '30', 10);
+const LATENCY_MS = parseInt(process.env.BENCH_LATENCY_MS || '40', 10);
+
+const PHRASES = [
+  'buenos días', 'hasta mañana', 'la tarea es difícil', 'no entiendo la pregunta',
+  'good morning', 'see you tomorrow', 'the homework is hard', 'I do not understand'
+];
+// [source, target]; a null source makes the function call detect first
+const PAIRS = [['spanish', 'english'], ['english', 'spanish'], [null, 'english']];
+
+function percentile(sorted, p) {
+  return sorted[Math.min(sorted.length - 1, Math.ceil(p / 100 * sorted.length) - 1)];
+}
+
+// Deterministic workload so both modes replay the same requests
+function workload() {
+  let seed = 7;
+  const rand = n => {
+    seed = (seed * 1103515245 + 12345) % 2147483648;
+    return seed % n;
+  };
+  const rounds = [];
+  for (let r = 0; r < ROUNDS; r++) {
+    const students = [];
+    for (let s = 0; s < CLASS_SIZE; s++) {
+      const [source, target] = PAIRS[rand(PAIRS.length)];
+      // Round-specific text, so every burst misses the cache
+      students.push({ text: `${PHRASES[rand(PHRASES.length)]} (${r})`, source, target, delay: rand(4) });
+    }
+    rounds.push(students);
+  }
+  return rounds;
+}
+
+function startMock() {
+  const calls = { detect: 0, translate: 0, texts: 0 };
+  const server = http.createServer((req, res) => {
+    let raw = '';
+    req.on('data', chunk => { raw += chunk; });
+    req.on('end', () => {
+      const body = JSON.parse(raw || '{}');
+      const qs = Array.isArray(body.q) ? body.q : [body.q];
+      calls.texts += qs.length;
+      let json;
+      if (req.url.includes('/detect')) {
+        calls.detect++;
+        json = { data: { detections: qs.map(q => [{ language: /[áéíóúñ]|\b(la|es|no)\b/.test(q) ? 'es' : 'en', confidence: 0.9 }]) } };
+      } else {
+        calls.translate++;
+        json = { data: { translations: qs.map(q => ({ translatedText: `[${body.target}] ${q}` })) } };
+      }
+      setTimeout(() => {
+        res.writeHead(200, { 'Content-Type': 'application/json' });
+        res.end(JSON.stringify(json));
+      }, LATENCY_MS);
+    });
+  });
+  return new Promise(resolve => server.listen(0, '127.0.0.1', () => resolve({ server, calls })));
+}
+
+// Child process: run the workload once with the coalescing settings in its env
+async function runMode() {
+  const { server, calls } = await startMock();
+  process.env.GOOGLE_API_KEY = 'DUMMY_KEY_FOR_BENCH';
+  process.env.GOOGLE_TRANSLATE_URL = `http://127.0.0.1:${server.address().port}/language/translate/v2`;
+  process.env.TRANSLATE_CACHE_MAX_ENTRIES = '0';
+  console.log = () => {};
+  const fn = require(path.join(__dirname, 'translate.js'));
+
+  const latencies = [];
+  const started = Date.now();
+  for (const students of workload()) {
+    await Promise.all(students.map(async ({ text, source, target, delay }) => {
+      await new Promise(resolve => setTimeout(resolve, delay));
+      const t0 = process.hrtime.bigint();
+      const res = await fn.handler({ httpMethod: 'POST', body: JSON.stringify({ text, source, target }) });
+      if (res.statusCode !== 200) throw new Error(`status ${res.statusCode}: ${res.body}`);
+      latencies.push(Number(process.hrtime.bigint() - t0) / 1e6);
+    }));
+  }
+  const elapsed = Date.now() - started;
+  server.close();
+
+  latencies.sort((a, b) => a - b);
+  process.send({
+    requests: latencies.length,
+    upstreamCalls: calls.detect + calls.translate,
+    detectCalls: calls.detect,
+    translateCalls: calls.translate,
+    textsSent: calls.texts,
+    p50Ms: +percentile(latencies, 50).toFixed(2),
+    p99Ms: +percentile(latencies, 99).toFixed(2),
+    elapsedMs: elapsed,
+    batching: fn.cacheStats().batching
+  });
+}
+
+function spawnMode(env) {
+  return new Promise((resolve, reject) => {
+    const child = fork(__filename, [], { env: { ...process.env, ...env, BENCH_CHILD: '1' } });
+    child.on('message', resolve);
+    child.on('error', reject);
+    child.on('exit', code => { if (code) reject(new Error(`benchmark child exited with ${code}`)); });
+  });
+}
+
+async function main() {
+  const results = {
+    unbatched: await spawnMode({ TRANSLATE_COALESCE: '0' }),
+    batched: await spawnMode({ TRANSLATE_COALESCE: '1' })
+  };
+  if (process.argv.includes('--json')) {
+    console.log(JSON.stringify({ rounds: ROUNDS, classSize: CLASS_SIZE, latencyMs: LATENCY_MS, results }, null, 2));
+    return;
+  }
+  console.log(`${ROUNDS} bursts of ${CLASS_SIZE} requests, mock upstream latency ${LATENCY_MS} ms\n`);
+  console.log('mode        requests  upstream  (detect/translate)  p50 ms   p99 ms');
+  for (const [mode, r] of Object.entries(results)) {
+    console.log(
+      `${mode.padEnd(11)} ${String(r.requests).padStart(8)}  ${String(r.upstreamCalls).padStart(8)}  ` +
+      `${`(${r.detectCalls}/${r.translateCalls})`.padStart(18)}  ${r.p50Ms.toFixed(1).padStart(6)}  ${r.p99Ms.toFixed(1).padStart(7)}`
+    );
+  }
+  const { unbatched, batched } = results;
+  console.log(`\nUpstream calls reduced ${(unbatched.upstreamCalls / batched.upstreamCalls).toFixed(1)}x ` +
+    `(${batched.batching.translate.deduped + batched.batching.detect.deduped} in-flight duplicates shared)`);
+}
+
+if (process.env.BENCH_CHILD) {
+  runMode().catch(err => { console.error(err); process.exit(1); });
+} else {
+  main().catch(err => { console.error(err); process.exit(1); });
+}
@@ -0,0 +1,196 @@
+// Test runner for the translate result cache - serves Google Translate and DeepL
+// from a local stub server and checks which requests actually reach it.
+// Run with: node netlify/functions/test_translate_cache_runner.js
+
+const assert = require('assert');
+const http = require('http');
+const path = require('path');
+
+const upstream = { detect: 0, translate: 0, deepl: 0 };
+
+// Minimal stand-ins for the provider endpoints
+const server = http.createServer((req, res) => {
+  let raw = '';
+  req.on('data', chunk => { raw += chunk; });
+  req.on('end', () => {
+    const body = JSON.parse(raw || '{}');
+    let json;
+    if (req.url.startsWith('/google/detect')) {
+      upstream.detect++;
+      const detections = body.q.map(q => [{ language: /¿|\bqué\b|\bpregunta\b|\btengo\b/i.test(q) ? 'es' : 'en', confidence: 0.9 }]);
+      json = { data: { detections } };
+    } else if (req.url.startsWith('/google')) {
+      upstream.translate++;
+      const translations = body.q.map(q => ({ translatedText: `TRANSLATED(${body.source || 'auto'}->${body.target}):${q}` }));
+      json = { data: { translations } };
+    } else if (req.url.startsWith('/deepl')) {
+      upstream.deepl++;
+      json = { translations: body.text.map(text => ({ text: `DEEPL(${body.target_lang}):${text}` })) };
+    } else {
+      res.writeHead(404);
+      res.end();
+      return;
+    }
+    res.writeHead(200, { 'Content-Type': 'application/json' });
+    res.end(JSON.stringify(json));
+  });
+});
+
+// Vercel-style response object for api/translate.js
+function vercelResponse() {
+  const res = { statusCode: null, body: null };
+  res.status = code => { res.statusCode = code; return res; };
+  res.json = payload => { res.body = payload; return res; };
+  return res;
+}
+
+async function netlifyTranslate(fn, text, source, target) {
+  const res = await fn.handler({ httpMethod: 'POST', body: JSON.stringify({ text, source, target }) });
+  assert.strictEqual(res.statusCode, 200, res.body);
+  return JSON.parse(res.body).result;
+}
+
+async function vercelTranslate(fn, text, source, target) {
+  const res = vercelResponse();
+  await fn({ method: 'POST', body: { text, source, target } }, res);
+  assert.strictEqual(res.statusCode, 200, JSON.stringify(res.body));
+  return res.body.result;
+}
+
+(async function() {
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  const base = `http://127.0.0.1:${server.address().port}`;
+  process.env.GOOGLE_API_KEY = 'DUMMY_KEY_FOR_TEST';
+  process.env.GOOGLE_TRANSLATE_URL = `${base}/google`;
+  process.env.DEEPL_API_KEY = 'DUMMY_KEY_FOR_TEST';
+  process.env.DEEPL_URL = `${base}/deepl`;
+  process.env.TRANSLATE_CACHE_MAX_ENTRIES = '3';
+  process.env.TRANSLATE_CACHE_TTL_MS = '200';
+
+  // Keep the handlers' request logging out of the report
+  const log = console.log;
+  console.log = () => {};
+  const netlify = require(path.join(__dirname, 'translate.js'));
+  const vercel = require(path.join(__dirname, '..', '..', 'api', 'translate.js'));
+  const results = [];
+  const check = (name, fn) => results.push([name, fn]);
+
+  try {
+    check('repeated phrase is translated upstream once', async () => {
+      const first = await netlifyTranslate(netlify, 'Tengo una pregunta.', 'spanish', 'english');
+      const before = upstream.translate;
+      const second = await netlifyTranslate(netlify, '  Tengo   una pregunta. ', 'spanish', 'english');
+      assert.strictEqual(second, first);
+      assert.strictEqual(upstream.translate, before);
+    });
+
+    check('detect results are cached', async () => {
+      await netlifyTranslate(netlify, 'Qué hora es', null, 'english');
+      const before = upstream.detect;
+      await netlifyTranslate(netlify, 'Qué hora es', null, 'english');
+      assert.strictEqual(upstream.detect, before);
+    });
+
+    check('infinitives and their meanings never reach the API', async () => {
+      const before = { ...upstream };
+      assert.strictEqual(await netlifyTranslate(netlify, 'tener', 'spanish', 'english'), 'to have (possession)');
+      assert.strictEqual(await netlifyTranslate(netlify, 'to eat', 'english', 'spanish'), 'comer');
+      assert.deepStrictEqual(upstream, before);
+    });
+
+    check('Spanish-only verb forms skip detection but are translated upstream', async () => {
+      const before = { ...upstream };
+      assert.strictEqual(await netlifyTranslate(netlify, 'tú tienes', null, 'english'), 'TRANSLATED(es->en):tú tienes');
+      assert.strictEqual(upstream.detect, before.detect);
+      assert.strictEqual(upstream.translate, before.translate + 1);
+    });
+
+    check('verb forms that are also English words are still detected', async () => {
+      const before = upstream.detect;
+      assert.strictEqual(await netlifyTranslate(netlify, 'he', null, 'spanish'), 'TRANSLATED(en->es):he');
+      assert.strictEqual(await netlifyTranslate(netlify, 'sea', null, null), 'TRANSLATED(en->es):sea');
+      assert.strictEqual(upstream.detect, before + 2);
+    });
+
+    check('conjugated forms get a real translation, cached', async () => {
+      const before = upstream.translate;
+      for (const text of ['comí', 'nosotros comemos', 'está', 'como', 'fuera', 'hemos comido']) {
+        assert.strictEqual(await netlifyTranslate(netlify, text, 'spanish', 'english'), `TRANSLATED(es->en):${text}`);
+      }
+      assert.strictEqual(await netlifyTranslate(netlify, 'eat', 'english', 'spanish'), 'TRANSLATED(en->es):eat');
+      assert.strictEqual(upstream.translate, before + 7);
+      await netlifyTranslate(netlify, 'eat', 'english', 'spanish');
+      assert.strictEqual(upstream.translate, before + 7);
+    });
+
+    check('least recently used entries are evicted', async () => {
+      for (const word of ['uno', 'dos', 'tres', 'cuatro']) {
+        await netlifyTranslate(netlify, `palabra ${word}`, 'spanish', 'english');
+      }
+      const before = upstream.translate;
+      await netlifyTranslate(netlify, 'palabra uno', 'spanish', 'english');
+      assert.strictEqual(upstream.translate, before + 1);
+      assert.ok(netlify.cacheStats().translate.evictions > 0);
+    });
+
+    check('entries expire after the TTL', async () => {
+      await netlifyTranslate(netlify, 'hasta luego', 'spanish', 'english');
+      await new Promise(resolve => setTimeout(resolve, 250));
+      const before = upstream.translate;
+      await netlifyTranslate(netlify, 'hasta luego', 'spanish', 'english');
+      assert.strictEqual(upstream.translate, before + 1);
+      assert.ok(netlify.cacheStats().translate.expirations > 0);
+    });
+
+    check('concurrent requests share one upstream call per language pair', async () => {
+      const before = upstream.translate;
+      const texts = ['buenas noches', 'buenas tardes', 'buenas noches', 'muchas gracias'];
+      const results = await Promise.all([
+        ...texts.map(text => netlifyTranslate(netlify, text, 'spanish', 'english')),
+        netlifyTranslate(netlify, 'good night', 'english', 'french')
+      ]);
+      assert.strictEqual(results[0], results[2]);
+      assert.strictEqual(results[4], 'TRANSLATED(en->fr):good night');
+      assert.strictEqual(upstream.translate, before + 2);
+      assert.ok(netlify.cacheStats().batching.translate.deduped > 0);
+    });
+
+    check('stats are served on GET ?stats=1', async () => {
+      const res = await netlify.handler({ httpMethod: 'GET', queryStringParameters: { stats: '1' } });
+      const stats = JSON.parse(res.body);
+      assert.ok(stats.catalogLoaded);
+      assert.ok(stats.translate.hits > 0 && stats.catalogHits > 0);
+      assert.strictEqual(stats.upstreamCalls, upstream.detect + upstream.translate);
+    });
+
+    check('api/translate.js (DeepL) caches and uses the catalog', async () => {
+      const first = await vercelTranslate(vercel, 'Buenos días', 'spanish', 'english');
+      await vercelTranslate(vercel, 'Buenos días', 'spanish', 'english');
+      assert.strictEqual(await vercelTranslate(vercel, 'comer', 'spanish', 'english'), 'to eat');
+      assert.strictEqual(first, 'DEEPL(EN):Buenos días');
+      assert.strictEqual(upstream.deepl, 1);
+      assert.strictEqual(await vercelTranslate(vercel, 'comí', 'spanish', 'english'), 'DEEPL(EN):comí');
+      assert.strictEqual(upstream.deepl, 2);
+      const res = vercelResponse();
+      await vercel({ method: 'GET', query: { stats: '1' } }, res);
+      assert.strictEqual(res.body.translate.hits, 1);
+    });
+
+    let failed = 0;
+    for (const [name, fn] of results) {
+      try {
+        await fn();
+        log(`PASS ${name}`);
+      } catch (err) {
+        failed++;
+        log(`FAIL ${name}\n  ${err.message}`);
+      }
+    }
+    log('\nUpstream requests:', upstream);
+    log('Cache stats:', JSON.stringify(netlify.cacheStats()));
+    process.exitCode = failed ? 1 : 0;
+  } finally {
+    console.log = log;
+    server.close();
+  }
+})();
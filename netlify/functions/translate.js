@@ -2,6 +2,8 @@
 // This file was migrated from the local server implementation so behavior is consistent
 
 const GOOGLE_API_KEY = process.env.GOOGLE_API_KEY;
+// Overridable so the function can be exercised against a local stub server
+const GOOGLE_TRANSLATE_URL = process.env.GOOGLE_TRANSLATE_URL || 'https://translation.googleapis.com/language/translate/v2';
 // Safe debug: log presence of the API key (masked) so we can tell if Netlify injected it
 try {
   if (GOOGLE_API_KEY) {
@@ -35,6 +37,32 @@ try {
   languageAliases = {};
 }
 
+// Cache, batching and verb catalog shared with the other translate function (repo root)
+let shared;
+try {
+  shared = require(path.join(__dirname, '..', '..', 'translate_shared.js'));
+} catch (e) {
+  shared = require(path.join(__dirname, 'translate_shared.js'));
+}
+const { verbCatalog, CACHE_MAX_ENTRIES, CACHE_TTL_MS, TTLCache, MicroBatcher, normalizeText, catalogKey, findSpanishVerb, isSpanishOnly, lookupCatalog } = shared;
+
+const translateCache = new TTLCache(CACHE_MAX_ENTRIES, CACHE_TTL_MS);
+const detectCache = new TTLCache(CACHE_MAX_ENTRIES, CACHE_TTL_MS);
+const counters = { catalogHits: 0, upstreamCalls: 0 };
+// Upstream batch size; the window and TRANSLATE_COALESCE switch live in translate_shared.js
+const BATCH_MAX_ITEMS = parseInt(process.env.TRANSLATE_BATCH_MAX_ITEMS || '100', 10); // Google accepts up to 128 texts per request
+
+function cacheStats() {
+  return {
+    translate: translateCache.stats(),
+    detect: detectCache.stats(),
+    catalogHits: counters.catalogHits,
+    upstreamCalls: counters.upstreamCalls,
+    batching: { translate: translateBatcher.stats(), detect: detectBatcher.stats() },
+    catalogLoaded: !!verbCatalog
+  };
+}
+
 const canonicalToCode = {
   english: 'en',
   spanish: 'es',
@@ -127,9 +155,11 @@ function resolveLanguageName(name) {
   return null;
 }
 
-async function callGoogleDetect(q) {
-  const url = `https://translation.googleapis.com/language/translate/v2/detect?key=${GOOGLE_API_KEY}`;
-  const payload = { q: String(q) };
+// Detect several texts in one request; returns one detection per text
+async function callGoogleDetect(qs) {
+  const url = `${GOOGLE_TRANSLATE_URL}/detect?key=${GOOGLE_API_KEY}`;
+  const payload = { q: qs.map(String) };
+  counters.upstreamCalls++;
   const apiRes = await fetch(url, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
@@ -150,20 +180,21 @@ async function callGoogleDetect(q) {
     throw err;
   }
   const json = await apiRes.json();
-  if (json && json.data && json.data.detections && json.data.detections[0] && json.data.detections[0][0]) {
-    const detected = json.data.detections[0][0];
+  const detections = json && json.data && json.data.detections;
+  if (detections && detections.length === qs.length && detections.every(d => d && d[0])) {
     // Return both language and confidence
-    return { language: detected.language, confidence: detected.confidence || 0, isReliable: detected.isReliable };
+    return detections.map(([detected]) => ({ language: detected.language, confidence: detected.confidence || 0, isReliable: detected.isReliable }));
   }
   throw new Error('Invalid response from Google Detect');
 }
 
-async function callGoogleTranslate(q, target, source) {
-  const url = `https://translation.googleapis.com/language/translate/v2?key=${GOOGLE_API_KEY}`;
-  const payload = { q: String(q), target: target, format: 'text' };
+// Translate several texts for one language pair; returns one translation per text
+async function callGoogleTranslate(qs, target, source) {
+  const url = `${GOOGLE_TRANSLATE_URL}?key=${GOOGLE_API_KEY}`;
+  const payload = { q: qs.map(String), target: target, format: 'text' };
   if (source) payload.source = source;
 
-
+  counters.upstreamCalls++;
   const apiRes = await fetch(url, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
@@ -187,17 +218,56 @@ async function callGoogleTranslate(q, target, source) {
 
   const json = await apiRes.json();
 
-  if (json && json.data && json.data.translations && json.data.translations[0]) {
-    return json.data.translations[0];
+  if (json && json.data && json.data.translations && json.data.translations.length === qs.length) {
+    return json.data.translations;
   }
   const err = new Error('Invalid response from Google Translate');
   err.raw = json;
   throw err;
 }
 
+const detectBatcher = new MicroBatcher(callGoogleDetect, BATCH_MAX_ITEMS);
+const translateBatcher = new MicroBatcher(callGoogleTranslate, BATCH_MAX_ITEMS);
+
+// Detect with the cache in front; catalog verbs that can only be Spanish skip the API
+async function cachedDetect(q) {
+  const key = normalizeText(q);
+  const cached = detectCache.get(key);
+  if (cached) return cached;
+  const verbKey = catalogKey(q);
+  if (isSpanishOnly(q) && findSpanishVerb(verbKey) && verbCatalog.english[verbKey] === undefined) {
+    counters.catalogHits++;
+    return { language: 'es', confidence: 1, isReliable: true };
+  }
+  const detected = await detectBatcher.request(key, 'detect', [], q);
+  detectCache.set(key, detected);
+  return detected;
+}
+
+// Translate with the cache in front; misses try the local verb catalog before the API
+async function cachedTranslate(q, target, source) {
+  const key = `${source || 'auto'}|${target}|${normalizeText(q)}`;
+  const cached = translateCache.get(key);
+  if (cached) return cached;
+  const local = lookupCatalog(q, source, target);
+  if (local) {
+    counters.catalogHits++;
+    return { translatedText: local };
+  }
+  const translated = await translateBatcher.request(key, `${source || 'auto'}|${target}`, [target, source], q);
+  translateCache.set(key, translated);
+  return translated;
+}
+
+exports.cacheStats = cacheStats;
+
 exports.handler = async function(event) {
   console.log('translate handler invoked');
   try {
+    // GET ?stats=1 reports the cache counters of this warm instance
+    if (event.httpMethod === 'GET' && event.queryStringParameters && event.queryStringParameters.stats) {
+      return { statusCode: 200, body: JSON.stringify(cacheStats()) };
+    }
     console.log('Incoming event body (raw):', typeof event.body === 'string' ? event.body.slice(0,1000) : event.body);
     if (!GOOGLE_API_KEY) return { statusCode: 500, body: JSON.stringify({ error: 'Server: API key not configured' }) };
     const body = JSON.parse(event.body || '{}');
@@ -230,7 +300,7 @@ exports.handler = async function(event) {
       // If we don't know the source language, try to detect it using Google Detect
       if (!sourceCode) {
         try {
-          const detected = await callGoogleDetect(text);
+          const detected = await cachedDetect(text);
           if (detected) {
             let detectedLang = detected.language;
             // Spanish flag site: Spanish/Portuguese share many words and get misdetected.
@@ -261,7 +331,7 @@ exports.handler = async function(event) {
       }
 
       if (sourceCode && sourceCode !== 'en') {
-        const t = await callGoogleTranslate(text, 'en', sourceCode);
+        const t = await cachedTranslate(text, 'en', sourceCode);
         englishText = t.translatedText || String(text);
       } else {
         englishText = String(text);
@@ -321,7 +391,7 @@ exports.handler = async function(event) {
           // Only call Google Translate if we have a valid source code to translate FROM
           // If sourceCode is not available or null, fall through to fallback
           if (sourceCode && sourceCode !== extractedTargetCode) {
-            const translated = await callGoogleTranslate(phraseToTranslate || text, extractedTargetCode, sourceCode);
+            const translated = await cachedTranslate(phraseToTranslate || text, extractedTargetCode, sourceCode);
             // Return only the translated phrase as the direct answer and include detected/source info
             return {
               statusCode: 200,
@@ -339,7 +409,7 @@ exports.handler = async function(event) {
     // Fallback: translate from source to target language using user's preference
     try {
       console.log('Calling Google Translate for fallback', { text: text.slice(0,200), targetCode, sourceCode });
-      const translated = await callGoogleTranslate(text, targetCode, sourceCode);
+      const translated = await cachedTranslate(text, targetCode, sourceCode);
       return {
         statusCode: 200,
         body: JSON.stringify({ result: translated.translatedText, detectedSource: detectedSource, targetUsed: targetCode })
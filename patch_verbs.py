@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Incremental subjunctive patcher for slt_verbs.js.
+Streams the catalog once, entry by entry, and splices the generated subjunctive
+tenses into each verb whose source changed since the last run. Unchanged verbs
+are copied through untouched and the file is only rewritten (atomically) when
+at least one entry actually differs.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+
+from add_subjunctive_helper import SUBJUNCTIVE_TENSES, VERBS_PATH, conjugate_subjunctive
+
+STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slt_verbs.patch.json')
+ENGINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'add_subjunctive_helper.py')
+
+TENSE_LINE = re.compile(r'^(\s*)"([^"]+)":\s*(\[.*\])\s*,?\s*$')
+SPANISH_LINE = re.compile(r'^\s*"?spanish"?\s*:\s*"([^"]*)"')
+CONJUGATIONS_LINE = re.compile(r'^\s*"?conjugations"?\s*:\s*\{')
+QUOTED = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+def _brace_delta(line):
+    """
+    Net change in `{ }` nesting for one line, ignoring braces inside strings.
+    """
+    bare = QUOTED.sub('', line)
+    return bare.count('{') - bare.count('}')
+
+
+def iter_chunks(lines):
+    """
+    Split the catalog into ('text', lines) runs and ('verb', lines) entries.
+    lines: iterable of decoded source lines, newline included
+    """
+    depth = 0
+    buffer = []
+    for line in lines:
+        before = depth
+        depth += _brace_delta(line)
+        if before == 0 and depth > 0 and buffer:
+            yield 'text', buffer
+            buffer = []
+        buffer.append(line)
+        if before > 0 and depth == 0:
+            yield 'verb', buffer
+            buffer = []
+    if buffer:
+        yield 'text', buffer
+
+
+def engine_hash(path=ENGINE_PATH):
+    """
+    Digest of the generator source; a new engine invalidates every record.
+    """
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def source_key(entry, engine):
+    """
+    Hash of everything in an entry the generator reads: all lines except the
+    generated subjunctive tenses, plus the engine version.
+    """
+    digest = hashlib.sha256(engine.encode())
+    for line in entry:
+        match = TENSE_LINE.match(line)
+        if match and match.group(2) in SUBJUNCTIVE_TENSES:
+            continue
+        digest.update(line.rstrip().rstrip(',').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def text_hash(entry):
+    return hashlib.sha256(''.join(entry).encode('utf-8')).hexdigest()
+
+
+def patch_entry(entry):
+    """
+    Return the entry lines with the subjunctive block regenerated, or the
+    original list if the verb cannot be conjugated by rule.
+    """
+    spanish_verb = None
+    in_conjugations = False
+    tense_lines = []
+    conjugations = {}
+    for position, line in enumerate(entry):
+        if not in_conjugations:
+            match = SPANISH_LINE.match(line)
+            if match and spanish_verb is None:
+                spanish_verb = match.group(1)
+            in_conjugations = bool(CONJUGATIONS_LINE.match(line))
+            continue
+        match = TENSE_LINE.match(line)
+        if match:
+            tense_lines.append(position)
+            if match.group(2) not in SUBJUNCTIVE_TENSES:
+                conjugations[match.group(2)] = json.loads(match.group(3))
+    if spanish_verb is None or not tense_lines:
+        return entry
+    subjunctive = conjugate_subjunctive(spanish_verb, conjugations)
+    if not subjunctive:
+        return entry
+
+    first, last = tense_lines[0], tense_lines[-1]
+    indent = TENSE_LINE.match(entry[first]).group(1)
+    newline = '\r\n' if entry[first].endswith('\r\n') else '\n'
+    body = [line.rstrip().rstrip(',') for line in entry[first:last + 1]
+            if not (TENSE_LINE.match(line) and TENSE_LINE.match(line).group(2) in SUBJUNCTIVE_TENSES)]
+    for tense in SUBJUNCTIVE_TENSES:
+        if tense in subjunctive:
+            body.append(f'{indent}"{tense}": {json.dumps(subjunctive[tense], ensure_ascii=False)}')
+    block = [line + ',' + newline for line in body[:-1]] + [body[-1] + newline]
+    return entry[:first] + block + entry[last + 1:]
+
+
+def load_state(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state.get('entries', {})
+
+
+def save_state(path, entries):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'entries': entries}, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def patch_file(verbs_path=VERBS_PATH, state_path=STATE_PATH, dry_run=False):
+    """
+    Patch slt_verbs.js in place.
+    state_path: sidecar mapping each entry's source hash to the hash of its
+    patched text, so unchanged verbs are skipped without running the generator
+    dry_run: report what would change without writing anything
+    Returns a dict of counts.
+    """
+    engine = engine_hash()
+    known = load_state(state_path)
+    seen = {}
+    stats = {'verbs': 0, 'skipped': 0, 'regenerated': 0, 'patched': 0}
+    out = None
+    tmp_path = verbs_path + '.tmp'
+    consumed = 0
+
+    with open(verbs_path, encoding='utf-8', newline='') as source:
+        try:
+            for kind, chunk in iter_chunks(source):
+                result = chunk
+                if kind == 'verb':
+                    stats['verbs'] += 1
+                    key = source_key(chunk, engine)
+                    current = text_hash(chunk)
+                    if known.get(key) == current:
+                        stats['skipped'] += 1
+                    else:
+                        stats['regenerated'] += 1
+                        result = patch_entry(chunk)
+                        if result != chunk:
+                            stats['patched'] += 1
+                    seen[key] = text_hash(result)
+
+                if result != chunk and out is None and not dry_run:
+                    # First real change: copy the untouched prefix, then keep streaming
+                    out = open(tmp_path, 'w', encoding='utf-8', newline='')
+                    with open(verbs_path, encoding='utf-8', newline='') as prefix:
+                        out.write(prefix.read(consumed))
+                if out is not None:
+                    out.writelines(result)
+                consumed += sum(len(line) for line in chunk)
+        except BaseException:
+            if out is not None:
+                out.close()
+                os.remove(tmp_path)
+            raise
+
+    if out is not None:
+        out.close()
+        shutil.copymode(verbs_path, tmp_path)
+        os.replace(tmp_path, verbs_path)
+    if not dry_run and seen != known:
+        save_state(state_path, seen)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--state', default=STATE_PATH, help='path to the per-verb hash sidecar')
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = patch_file(args.verbs, args.state, args.dry_run)
+    elapsed = time.perf_counter() - start
+    action = 'Would patch' if args.dry_run else 'Patched'
+    print(f"{action} {stats['patched']} of {stats['verbs']} verbs "
+          f"({stats['skipped']} unchanged since last run, {stats['regenerated']} regenerated) in {elapsed:.3f}s")
+    if stats['patched'] and not args.dry_run:
+        print("Rebuild the derived files with: python reverse_index.py build && python english_index.py build && python verb_bundles.py && python translate_catalog.py")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
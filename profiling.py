@@ -0,0 +1,264 @@
+"""
+Optional profiling for the verb tooling.
+Records wall time, call counts and tracemalloc allocations per pipeline stage
+(parse, stems, generate, validate, emit), inclusive time per instrumented
+function and the slowest verbs, and writes them as one JSON file that is both
+a flat summary and a Chrome trace-event file (chrome://tracing, Perfetto,
+speedscope).
+
+Profiling is off unless SLT_PROFILE names an output file or a script's
+--profile flag calls enable(). While it is off, stage() hands back a shared
+no-op context manager, active() returns None so per-verb spans are skipped,
+and instrument() leaves functions untouched.
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import multiprocessing
+import os
+import time
+import tracemalloc
+
+PROFILE_ENV = 'SLT_PROFILE'
+SLOWEST_VERBS = 10
+TOP_ALLOCATIONS = 10
+
+_NULL_STAGE = contextlib.nullcontext()
+_profiler = None
+
+
+def _now_us():
+    # perf_counter is system-wide on Linux, so worker timestamps line up with the parent's
+    return time.perf_counter() * 1e6
+
+
+class Profiler:
+    """
+    Collects stage, function and per-verb timings for one process.
+    trace_malloc: also track allocations with tracemalloc (several times slower)
+    """
+
+    def __init__(self, trace_malloc=True):
+        self.pid = os.getpid()
+        self.started = _now_us()
+        self.trace_malloc = trace_malloc
+        self.stages = {}
+        self.functions = {}
+        self.verbs = {}
+        self.events = []
+        self._open_stages = []
+        self._verb_depth = 0
+        if trace_malloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _event(self, name, category, start, end, args=None):
+        event = {'name': name, 'cat': category, 'ph': 'X', 'ts': round(start, 1),
+                 'dur': round(end - start, 1), 'pid': self.pid, 'tid': 0}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Time one pipeline stage. Stages may nest (validation generates forms);
+        the wall time and allocations of an outer stage include its inner ones.
+        """
+        tracing = self.trace_malloc and tracemalloc.is_tracing()
+        frame = {'before': 0, 'peak': 0}
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._open_stages:
+                # reset_peak() is global, so hand the peak so far to the enclosing stage
+                outer = self._open_stages[-1]
+                outer['peak'] = max(outer['peak'], peak)
+            tracemalloc.reset_peak()
+            frame['before'] = frame['peak'] = current
+        self._open_stages.append(frame)
+        start = _now_us()
+        try:
+            yield
+        finally:
+            end = _now_us()
+            self._open_stages.pop()
+            entry = self.stages.setdefault(name, {'calls': 0, 'wallMs': 0.0, 'allocatedBytes': 0, 'peakBytes': 0})
+            entry['calls'] += 1
+            entry['wallMs'] += (end - start) / 1000
+            args = None
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, frame['peak'])
+                if self._open_stages:
+                    self._open_stages[-1]['peak'] = max(self._open_stages[-1]['peak'], peak)
+                args = {'allocatedBytes': current - frame['before'], 'peakBytes': peak - frame['before']}
+                entry['allocatedBytes'] += args['allocatedBytes']
+                entry['peakBytes'] = max(entry['peakBytes'], args['peakBytes'])
+            self._event(name, 'stage', start, end, args)
+
+    @contextlib.contextmanager
+    def verb(self, spanish_verb, stage):
+        """
+        Time the work done for one verb inside a stage. Only the outermost
+        span counts towards the verb's total.
+        """
+        self._verb_depth += 1
+        start = _now_us()
+        try:
+            yield
+        finally:
+            end = _now_us()
+            self._verb_depth -= 1
+            if not self._verb_depth:
+                self.verbs[spanish_verb] = self.verbs.get(spanish_verb, 0.0) + (end - start) / 1000
+            self._event(spanish_verb, stage, start, end)
+
+    def count_call(self, name, ms):
+        entry = self.functions.setdefault(name, {'calls': 0, 'wallMs': 0.0})
+        entry['calls'] += 1
+        entry['wallMs'] += ms
+
+    def merge(self, snapshot):
+        """
+        Fold in counters drained in another process, e.g. a pool worker.
+        """
+        for name, other in snapshot['stages'].items():
+            entry = self.stages.setdefault(name, {'calls': 0, 'wallMs': 0.0, 'allocatedBytes': 0, 'peakBytes': 0})
+            entry['calls'] += other['calls']
+            entry['wallMs'] += other['wallMs']
+            entry['allocatedBytes'] += other['allocatedBytes']
+            entry['peakBytes'] = max(entry['peakBytes'], other['peakBytes'])
+        for name, other in snapshot['functions'].items():
+            entry = self.functions.setdefault(name, {'calls': 0, 'wallMs': 0.0})
+            entry['calls'] += other['calls']
+            entry['wallMs'] += other['wallMs']
+        for spanish_verb, ms in snapshot['verbs'].items():
+            self.verbs[spanish_verb] = self.verbs.get(spanish_verb, 0.0) + ms
+        self.events.extend(snapshot['traceEvents'])
+
+    def drain(self):
+        """
+        Return the raw counters for merge() in another process and start
+        counting from zero, so a pool worker can report once per task.
+        """
+        snapshot = {
+            'stages': self.stages,
+            'functions': self.functions,
+            'verbs': self.verbs,
+            'traceEvents': self.events,
+        }
+        self.stages, self.functions, self.verbs, self.events = {}, {}, {}, []
+        return snapshot
+
+    def report(self):
+        """
+        The flat summary plus the trace events, ready to dump as JSON.
+        """
+        def rounded(table):
+            return {name: dict(entry, wallMs=round(entry['wallMs'], 3)) for name, entry in table.items()}
+
+        allocations = []
+        if self.trace_malloc and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__)])
+            for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+                frame = stat.traceback[0]
+                allocations.append({'file': os.path.basename(frame.filename), 'line': frame.lineno,
+                                    'bytes': stat.size, 'blocks': stat.count})
+        slowest = sorted(self.verbs.items(), key=lambda item: item[1], reverse=True)[:SLOWEST_VERBS]
+        pids = sorted({event['pid'] for event in self.events} | {self.pid})
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                     'args': {'name': 'main' if pid == self.pid else f'worker {pid}'}} for pid in pids]
+        return {
+            'version': 1,
+            'totalMs': round((_now_us() - self.started) / 1000, 3),
+            'stages': rounded(self.stages),
+            'functions': rounded(self.functions),
+            'slowestVerbs': [{'verb': spanish_verb, 'ms': round(ms, 3)} for spanish_verb, ms in slowest],
+            'allocations': allocations,
+            'displayTimeUnit': 'ms',
+            'traceEvents': metadata + sorted(self.events, key=lambda event: event['ts']),
+        }
+
+    def write(self, path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+def enable(trace_malloc=True):
+    """
+    Turn profiling on for this process and return the profiler.
+    Calling it again returns the existing profiler; a forked worker gets a
+    fresh one instead of its copy of the parent's.
+    """
+    global _profiler
+    if _profiler is None or _profiler.pid != os.getpid():
+        _profiler = Profiler(trace_malloc)
+    return _profiler
+
+
+def active():
+    """
+    The running profiler, or None when profiling is off (or was only
+    inherited from the parent of a forked worker that has not enabled it).
+    """
+    if _profiler is not None and _profiler.pid == os.getpid():
+        return _profiler
+    return None
+
+
+def stage(name):
+    """
+    Context manager timing a pipeline stage; a shared no-op when profiling is off.
+    """
+    profiler = active()
+    return _NULL_STAGE if profiler is None else profiler.stage(name)
+
+
+def instrument(namespace, names):
+    """
+    Replace the named functions in a module namespace (pass globals()) with
+    counting wrappers. Calls made through module globals, including calls
+    between functions of the same module, are then counted. No-op when
+    profiling is off, so there is nothing left on the call path.
+    """
+    if _profiler is None:
+        return
+    for name in names:
+        func = namespace[name]
+        if not getattr(func, '__profiled__', False):
+            namespace[name] = _counted(name, func)
+
+
+def _counted(name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Looked up per call, so wrappers inherited by a forked worker report to its own profiler
+            _profiler.count_call(name, (time.perf_counter() - start) * 1000)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def write_report(path):
+    """
+    Write the profile to path; does nothing when profiling is off.
+    """
+    if _profiler is not None:
+        _profiler.write(path)
+
+
+# Pool workers inherit the environment, and spawn-start workers (Windows, macOS) re-import
+# this module. Only the top-level process profiles from SLT_PROFILE and writes the file;
+# workers are profiled on request (validate_shard(profile=True)) and report back to it.
+if os.environ.get(PROFILE_ENV) and multiprocessing.parent_process() is None:
+    enable()
+    _env_pid = os.getpid()
+    atexit.register(lambda: os.getpid() == _env_pid and write_report(os.environ[PROFILE_ENV]))
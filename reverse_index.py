@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Reverse conjugation index: surface form -> (verb, tense, person).
+Builds slt_conjugation_index.json, which slt_script.js loads once so practice
+mode can resolve a typed Spanish form with a dictionary probe instead of
+scanning every verb x tense x pronoun.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import unicodedata
+
+from add_subjunctive_helper import COMPOUND_AUXILIARIES, VERBS_PATH, generate_subjunctive_batch
+from verb_store import load_catalog, source_hash
+
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slt_conjugation_index.json')
+
+# Same order as `tenses` in slt_script.js; entries refer to tenses by position
+TENSES = (
+    'Present', 'Preterite', 'Imperfect', 'Future', 'Conditional',
+    'Present Perfect', 'Past Perfect', 'Future Perfect', 'Conditional Perfect',
+    'Present Subjunctive', 'Imperfect Subjunctive', 'Present Perfect Subjunctive', 'Past Perfect Subjunctive',
+)
+
+# Compound tenses are stored as auxiliary + participle instead of one key per form.
+# Packed entry layouts, shared with slt_script.js:
+#   form hit        verb * 128 + tense * 8 + person
+#   auxiliary hit   tense * 8 + person
+#   participle hit  verb * 8192 + bitmask of compound tenses the verb has
+TENSE_SHIFT = 8
+VERB_SHIFT = 128
+MASK_SHIFT = 8192
+
+_COMBINING = re.compile('[\u0300-\u036f]')
+
+
+def fold_accents(text):
+    """
+    Accent-folded, lowercased key; mirrors normalizeSpanish() in slt_script.js.
+    """
+    return _COMBINING.sub('', unicodedata.normalize('NFD', text.lower()))
+
+
+def _compound_participle(tense, forms):
+    """
+    Return the shared participle if every form is `<canonical auxiliary> <rest>`
+    with the same rest, otherwise None (the forms are then indexed whole).
+    """
+    if len(forms) != 6:
+        return None
+    rests = set()
+    for aux, form in zip(COMPOUND_AUXILIARIES[tense], forms):
+        head, _, rest = form.partition(' ')
+        if head != aux or not rest:
+            return None
+        rests.add(rest)
+    return rests.pop() if len(rests) == 1 else None
+
+
+def check_packing():
+    """
+    Raise ValueError if TENSES has outgrown the packed layouts above: tense * 8
+    must stay inside the 128 slot and one mask bit per tense inside 8192.
+    """
+    if len(TENSES) * TENSE_SHIFT > VERB_SHIFT or 1 << len(TENSES) > MASK_SHIFT:
+        raise ValueError(f'{len(TENSES)} tenses do not fit the packed index hits '
+                         f'(at most {VERB_SHIFT // TENSE_SHIFT} for form hits, {MASK_SHIFT.bit_length() - 1} for participle masks)')
+
+
+def build_index(verbs, subjunctive=None):
+    """
+    Build the reverse index for a parsed verb list.
+    verbs: catalog in slt_verbs.js order (indexes must match the JS `verbs` array)
+    subjunctive: generated subjunctive tenses per infinitive, used where the
+    catalog entry does not store them itself
+    """
+    check_packing()
+    if subjunctive is None:
+        subjunctive = generate_subjunctive_batch(verbs)
+    tense_ids = {tense: i for i, tense in enumerate(TENSES)}
+
+    forms = {}
+    generated = {}
+    auxiliaries = {}
+    participles = {}
+    infinitives = {}
+    for tense, auxes in COMPOUND_AUXILIARIES.items():
+        for person, aux in enumerate(auxes):
+            auxiliaries.setdefault(fold_accents(aux), []).append(tense_ids[tense] * TENSE_SHIFT + person)
+
+    seen = {}
+    for verb_index, verb in enumerate(verbs):
+        spanish_verb = verb['spanish']
+        infinitives.setdefault(fold_accents(spanish_verb), verb_index)
+        # Duplicate catalog entries only contribute forms the first one lacks
+        known = seen.setdefault(spanish_verb, set())
+        conjugations = dict(subjunctive.get(spanish_verb, {}))
+        conjugations.update(verb['conjugations'])
+        stored = verb['conjugations']
+
+        masks = {}
+        for tense, tense_forms in conjugations.items():
+            if tense not in tense_ids:
+                continue
+            participle = _compound_participle(tense, tense_forms) if tense in COMPOUND_AUXILIARIES else None
+            if participle is not None:
+                key = fold_accents(participle)
+                if (tense, key) not in known:
+                    known.add((tense, key))
+                    masks[key] = masks.get(key, 0) | (1 << tense_ids[tense])
+                continue
+            for person, form in enumerate(tense_forms[:6]):
+                key = fold_accents(form)
+                if (tense, person, key) in known:
+                    continue
+                known.add((tense, person, key))
+                # Generated subjunctive forms only match when no stored form does
+                table = forms if tense in stored else generated
+                table.setdefault(key, []).append(verb_index * VERB_SHIFT + tense_ids[tense] * TENSE_SHIFT + person)
+        for key, mask in masks.items():
+            participles.setdefault(key, []).append(verb_index * MASK_SHIFT + mask)
+
+    return {
+        'version': 1,
+        'verbCount': len(verbs),
+        'tenses': list(TENSES),
+        'forms': forms,
+        'generated': generated,
+        'auxiliaries': auxiliaries,
+        'participles': participles,
+        'infinitives': infinitives,
+    }
+
+
+def lookup(index, text):
+    """
+    All (verb index, tense, person) matches for a typed form, in catalog order.
+    Forms stored in slt_verbs.js win over generated subjunctive forms.
+    Same algorithm as lookupConjugation() in slt_script.js.
+    """
+    key = fold_accents(text.strip())
+    hits = list(index['forms'].get(key, ()))
+    head, _, rest = key.partition(' ')
+    aux_hits = index['auxiliaries'].get(head) if rest else None
+    if aux_hits:
+        for packed in index['participles'].get(rest, ()):
+            verb_index, mask = divmod(packed, MASK_SHIFT)
+            for aux in aux_hits:
+                if mask & (1 << (aux // TENSE_SHIFT)):
+                    hits.append(verb_index * VERB_SHIFT + aux)
+    if not hits:
+        hits = index['generated'].get(key, [])
+    return [(entry // VERB_SHIFT, index['tenses'][entry % VERB_SHIFT // TENSE_SHIFT], entry % TENSE_SHIFT)
+            for entry in sorted(set(hits))]
+
+
+def write_index(verbs_path=VERBS_PATH, output_path=INDEX_PATH):
+    """
+    Build the index from slt_verbs.js and write it as compact JSON.
+    """
+    index = build_index(load_catalog(verbs_path))
+    index['sourceHash'] = source_hash(verbs_path).hex()
+    payload = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(payload)
+    os.replace(tmp_path, output_path)
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--index', default=INDEX_PATH, help='path to the reverse index JSON')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='write the reverse index')
+    find = subparsers.add_parser('lookup', help='resolve a conjugated form')
+    find.add_argument('form')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        index = write_index(args.verbs, args.index)
+        print(f"Indexed {len(index['forms'])} forms and {len(index['participles'])} participles "
+              f"into {args.index} ({os.path.getsize(args.index)} bytes)")
+        return 0
+
+    with open(args.index, encoding='utf-8') as f:
+        index = json.load(f)
+    verbs = load_catalog(args.verbs)
+    matches = lookup(index, args.form)
+    if not matches:
+        print(f"No conjugation found for {args.form}", file=sys.stderr)
+        return 1
+    for verb_index, tense, person in matches:
+        print(f"{verbs[verb_index]['spanish']}\t{tense}\t{person}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
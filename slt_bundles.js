@@ -0,0 +1,89 @@
+// --- Sharded verb data (generated by verb_bundles.py) ---
+// loadVerbs() fetches the manifest, the verb list and the eager tense groups
+// (Present/Preterite). The other tense groups are fetched per frequency tier
+// the first time ensureTenses() is asked for them. If no bundles are
+// published, the monolithic slt_verbs.js is imported instead.
+
+const BUNDLE_DIR = './bundles/';
+
+let manifest = null;
+let verbs = [];
+const shardRequests = new Map();
+
+async function fetchJson(name) {
+  const res = await fetch(BUNDLE_DIR + name);
+  if (!res.ok) throw new Error(`Failed to load ${name}: ${res.status}`);
+  return res.json();
+}
+
+function tierOf(verbIdx) {
+  return manifest.tiers.findIndex(([start, stop]) => verbIdx >= start && verbIdx < stop);
+}
+
+// Fetch one shard once and copy its tenses onto the verb objects it covers.
+function loadShard(group, tier) {
+  const name = manifest.shards[group][tier];
+  if (!shardRequests.has(name)) {
+    const request = fetchJson(name).then(shard => {
+      shard.forms.forEach((row, offset) => {
+        const verb = verbs[shard.start + offset];
+        shard.tenses.forEach((tense, t) => {
+          if (row[t]) verb.conjugations[tense] = row[t];
+        });
+      });
+    });
+    // Let a failed request be retried on the next call
+    request.catch(() => shardRequests.delete(name));
+    shardRequests.set(name, request);
+  }
+  return shardRequests.get(name);
+}
+
+export async function loadVerbs() {
+  try {
+    const res = await fetch(BUNDLE_DIR + 'manifest.json', { cache: 'no-cache' });
+    if (!res.ok) throw new Error(`No bundle manifest (${res.status})`);
+    manifest = await res.json();
+    const meta = await fetchJson(manifest.verbs);
+    verbs = meta.map(({ english, spanish, type, memoryTip, tenses }) => ({
+      english,
+      spanish,
+      type,
+      memoryTip,
+      conjugations: {},
+      availableTenses: tenses
+    }));
+    await Promise.all(manifest.eager.flatMap(group => manifest.tiers.map((_, tier) => loadShard(group, tier))));
+  } catch (err) {
+    console.warn('Verb bundles unavailable, loading slt_verbs.js', err);
+    manifest = null;
+    verbs = (await import('./slt_verbs.js')).verbs;
+  }
+  return verbs;
+}
+
+// Hash of the slt_verbs.js the bundles were built from (null for the slt_verbs.js fallback).
+// Generated indexes record the same hash, so pages can tell if one is stale.
+export function sourceHash() {
+  return manifest ? manifest.sourceHash : null;
+}
+
+// True if the verb has this tense, whether or not its shard is loaded yet.
+export function hasTense(verb, tense) {
+  if (verb.conjugations[tense]) return true;
+  if (!manifest || verb.availableTenses === undefined) return false;
+  const bit = manifest.tenses.indexOf(tense);
+  return bit >= 0 && (verb.availableTenses & (1 << bit)) !== 0;
+}
+
+// Make sure the given tenses (all of them by default) are loaded for a verb.
+export async function ensureTenses(verb, tenseList = null) {
+  if (!manifest) return verb;
+  const tier = tierOf(verbs.indexOf(verb));
+  if (tier < 0) return verb;
+  const groups = Object.keys(manifest.groups).filter(group =>
+    !tenseList || manifest.groups[group].some(tense => tenseList.includes(tense))
+  );
+  await Promise.all(groups.map(group => loadShard(group, tier)));
+  return verb;
+}
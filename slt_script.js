@@ -1,4 +1,7 @@
-import { verbs } from './slt_verbs.js';
+import { loadVerbs, hasTense, ensureTenses, sourceHash } from './slt_bundles.js';
+
+// Core tenses only; the rest are fetched per verb with ensureTenses()
+const verbs = await loadVerbs();
 
 // --- Needed definitions from oldsltscript.js ---
 const pronouns = ["I", "You", "He", "We", "You all", "They"];
@@ -114,37 +117,140 @@ function normalizeSpanish(str) {
     .replace(/Ñ/g, "N");
 }
 
+// --- Generated indexes ---
+// Fetched on first use rather than at startup, so the first page load only pays for the bundles.
+function lazyFetch(url) {
+  let request = null;
+  return () => {
+    if (!request) {
+      request = fetch(url)
+        .then(res => (res.ok ? res.json() : null))
+        .catch(() => {
+          request = null; // retry on the next use
+          return null;
+        });
+    }
+    return request;
+  };
+}
+
+// Packed hits point into `verbs` by position, so an index is only usable if it was
+// built from the same slt_verbs.js as the loaded bundles.
+function isCurrentIndex(index) {
+  return !!index && index.verbCount === verbs.length && !!index.sourceHash && index.sourceHash === sourceHash();
+}
+
+// --- Reverse conjugation index (generated by reverse_index.py) ---
+// Fetched when Spanish practice is first used; until it arrives (or if it is stale)
+// practice mode scans the verbs directly.
+let conjugationIndex = null;
+const fetchConjugationIndex = lazyFetch('./slt_conjugation_index.json');
+function loadConjugationIndex() {
+  return fetchConjugationIndex().then(index => {
+    if (isCurrentIndex(index)) conjugationIndex = index;
+  });
+}
+practiceInputEs.addEventListener('focus', loadConjugationIndex, { once: true });
+
+// --- English phrase index (generated by english_index.py) ---
+// Fetched when English practice is first used; until it arrives (or if it is stale)
+// English practice mode builds and compares the English phrase for every
+// verb x meaning x tense x pronoun instead.
+let englishIndex = null;
+const fetchEnglishIndex = lazyFetch('./slt_english_index.json');
+function loadEnglishIndex() {
+  return fetchEnglishIndex().then(index => {
+    if (isCurrentIndex(index)) englishIndex = index;
+  });
+}
+practiceInputEn.addEventListener('focus', loadEnglishIndex, { once: true });
+
+// Packed hits for an accent-folded key, sorted in verbs x tenses x pronouns order.
+// Compound tenses are stored as auxiliary + participle (see reverse_index.py).
+function lookupConjugation(key) {
+  const hits = (conjugationIndex.forms[key] || []).slice();
+  const space = key.indexOf(' ');
+  const auxHits = space > 0 ? conjugationIndex.auxiliaries[key.slice(0, space)] : null;
+  const participleHits = auxHits ? conjugationIndex.participles[key.slice(space + 1)] : null;
+  if (participleHits) {
+    for (const packed of participleHits) {
+      const verbIdx = Math.floor(packed / 8192);
+      const mask = packed % 8192;
+      for (const aux of auxHits) {
+        if (mask & (1 << (aux >> 3))) hits.push(verbIdx * 128 + aux);
+      }
+    }
+  }
+  return hits.sort((a, b) => a - b);
+}
+
+// Resolve a typed form (optionally prefixed by its Spanish pronoun) with the index.
+// Generated subjunctive forms are only used when no form stored in slt_verbs.js matches.
+function findConjugation(input) {
+  const key = normalizeSpanish(input);
+  let best = null;
+  const consider = hits => {
+    if (hits.length && (best === null || hits[0] < best)) best = hits[0];
+  };
+  for (const lookup of [lookupConjugation, k => (conjugationIndex.generated[k] || []).slice().sort((a, b) => a - b)]) {
+    consider(lookup(key));
+    for (let i = 0; i < spanishPronouns.length; ++i) {
+      const prefix = normalizeSpanish(spanishPronouns[i].toLowerCase()) + ' ';
+      if (key.startsWith(prefix)) {
+        consider(lookup(key.slice(prefix.length)).filter(hit => hit % 8 === i));
+      }
+    }
+    if (best !== null) break;
+  }
+  if (best === null) return null;
+  return {
+    verb: verbs[Math.floor(best / 128)],
+    tense: conjugationIndex.tenses[Math.floor(best / 8) % 16],
+    pronounIdx: best % 8
+  };
+}
+
 // --- Practice Mode: Spanish → English ---
-practiceFormEs.onsubmit = function(e) {
+practiceFormEs.onsubmit = async function(e) {
   e.preventDefault();
   const input = practiceInputEs.value.trim().toLowerCase();
   if (!input) return;
 
   let found = null;
+  loadConjugationIndex();
   // 1. Try to match full conjugated forms (now accent-insensitive)
-  for (let verb of verbs) {
-    for (let t of tenses) {
-      if (!verb.conjugations[t]) continue;
-      for (let i = 0; i < spanishPronouns.length; ++i) {
-        const sp = verb.conjugations[t][i];
-        if (
-          sp &&
-          (
-            normalizeSpanish(`${spanishPronouns[i]} ${sp}`.toLowerCase()) === normalizeSpanish(input) ||
-            normalizeSpanish(sp.toLowerCase()) === normalizeSpanish(input)
-          )
-        ) {
-          found = {verb, tense: t, pronounIdx: i};
-          break;
+  if (conjugationIndex) {
+    found = findConjugation(input);
+  } else {
+    for (let verb of verbs) {
+      for (let t of tenses) {
+        if (!hasTense(verb, t)) continue;
+        // Only Present/Preterite are loaded up front
+        await ensureTenses(verb, [t]);
+        for (let i = 0; i < spanishPronouns.length; ++i) {
+          const sp = verb.conjugations[t][i];
+          if (
+            sp &&
+            (
+              normalizeSpanish(`${spanishPronouns[i]} ${sp}`.toLowerCase()) === normalizeSpanish(input) ||
+              normalizeSpanish(sp.toLowerCase()) === normalizeSpanish(input)
+            )
+          ) {
+            found = {verb, tense: t, pronounIdx: i};
+            break;
+          }
         }
+        if (found) break;
       }
       if (found) break;
     }
-    if (found) break;
   }
 
   // 2. If not found, try to match infinitive (e.g., "aprender"), accent-insensitive
-  if (!found) {
+  if (!found && conjugationIndex) {
+    const verbIdx = conjugationIndex.infinitives[normalizeSpanish(input)];
+    if (verbIdx !== undefined) found = {verb: verbs[verbIdx], tense: null, pronounIdx: null, isInfinitive: true};
+  } else if (!found) {
     for (let verb of verbs) {
       if (normalizeSpanish(verb.spanish.toLowerCase()) === normalizeSpanish(input)) {
         found = {verb, tense: null, pronounIdx: null, isInfinitive: true};
@@ -163,6 +269,7 @@ practiceFormEs.onsubmit = function(e) {
     </div>`;
     return;
   }
+  await ensureTenses(found.verb);
 
   // 3. If infinitive, show all tenses for all pronouns
   if (found.isInfinitive) {
@@ -308,10 +415,11 @@ practiceFormEs.onsubmit = function(e) {
 };
 
 // --- Practice Mode: English → Spanish ---
-practiceFormEn.onsubmit = function(e) {
+practiceFormEn.onsubmit = async function(e) {
   e.preventDefault();
   const input = practiceInputEn.value.trim();
   if (!input) return;
+  loadEnglishIndex();
 
   // If this is a tab click, meaningIdx is passed in the event
   let meaningIdx = (e && typeof e.meaningIdx === "number") ? e.meaningIdx : 0;
@@ -335,6 +443,7 @@ practiceFormEn.onsubmit = function(e) {
   let candidate = allCandidates[currentIdx] || allCandidates[0];
 
   let verb = candidate.verb;
+  await ensureTenses(verb);
   meaningIdx = candidate.meaningIdx || 0;
   const pronounIdx = (typeof candidate.pronounIdx === "number") ? candidate.pronounIdx : 0;
   const detectedTense = candidate.tense || "Present";
@@ -441,11 +550,12 @@ practiceFormEn.onsubmit = function(e) {
 };
 
 // --- Quiz Mode: Spanish → English ---
-function startQuiz() {
+async function startQuiz() {
   // Pick a random verb, tense, and pronoun
   const verb = verbs[Math.floor(Math.random() * verbs.length)];
-  const availableTenses = tenses.filter(t => verb.conjugations[t]);
+  const availableTenses = tenses.filter(t => hasTense(verb, t));
   const tense = availableTenses[Math.floor(Math.random() * availableTenses.length)];
+  await ensureTenses(verb, [tense]);
   const pronounIdx = Math.floor(Math.random() * pronouns.length);
   const spanish = verb.conjugations[tense][pronounIdx];
   const english = buildEnglishPhrase(verb, tense, pronounIdx);
@@ -467,9 +577,11 @@ function startQuiz() {
   quizFeedback.innerHTML = '';
 }
 
-quizForm.onsubmit = e => {
+quizForm.onsubmit = async e => {
   e.preventDefault();
   if (!quizState) return;
+  // The answer tables list every tense of the verb
+  await ensureTenses(quizState.verb);
   const userAnswer = quizInput.value.trim().toLowerCase();
   const correctAnswer = quizState.english.toLowerCase();
 
@@ -609,40 +721,78 @@ function showTensePopup(tense, def, anchor) {
   }, 10);
 }
 
+// --- Helper: Resolve English phrases with the English phrase index ---
+// Packed entries (see english_index.py): phrase hits are verb * 2048 + meaning * 128 +
+// tense * 8 + person, meaning hits are verb * 16 + meaning.
+function ownEntry(table, key) {
+  return Object.prototype.hasOwnProperty.call(table, key) ? table[key] : null;
+}
+
+// First exact gloss match, in verbs x meanings x tenses x pronouns order
+function findEnglishPhrase(phrase) {
+  for (const packed of ownEntry(englishIndex.phrases, phrase) || []) {
+    const verb = verbs[Math.floor(packed / 2048)];
+    const tense = englishIndex.tenses[(packed % 128) >> 3];
+    if (hasTense(verb, tense)) {
+      return { verb, tense, pronounIdx: packed % 8, meaningIdx: (packed % 2048) >> 7 };
+    }
+  }
+  return null;
+}
+
+// Meanings that start with the phrase (prefix trie walk) or equal it without "to "
+function findMeaningCandidates(phrase) {
+  let node = englishIndex.prefixes;
+  for (const ch of phrase) {
+    node = ownEntry(node, ch);
+    if (!node) break;
+  }
+  const hits = new Set([...((node && node['']) || []), ...(ownEntry(englishIndex.bases, phrase) || [])]);
+  return [...hits].sort((a, b) => a - b).map(packed => ({
+    verb: verbs[packed >> 4], tense: null, pronounIdx: null, meaningIdx: packed % 16
+  }));
+}
+
 // --- Helper: Parse English phrase to verb/tense/pronoun ---
 function parseEnglishPhrase(phrase, meaningIdx = 0) {
   phrase = phrase.trim().toLowerCase();
 
   // Collect all possible matches (for ambiguous verbs like "to have")
   let candidates = [];
-  for (let verb of verbs) {
-    let meanings = Array.isArray(verb.english) ? verb.english : [verb.english];
-    for (let idx = 0; idx < meanings.length; ++idx) {
-      // Remove parenthetical notes for matching
-      let meaningRaw = meanings[idx].toLowerCase();
-      let meaningNoParen = meaningRaw.replace(/\s*\(.*?\)\s*/g, '').trim();
-      let base = meaningRaw.replace(/^to /, '').split(',')[0].trim();
+  if (englishIndex) {
+    const exact = findEnglishPhrase(phrase);
+    if (exact) return exact;
+    candidates = findMeaningCandidates(phrase);
+  } else {
+    for (let verb of verbs) {
+      let meanings = Array.isArray(verb.english) ? verb.english : [verb.english];
+      for (let idx = 0; idx < meanings.length; ++idx) {
+        // Remove parenthetical notes for matching
+        let meaningRaw = meanings[idx].toLowerCase();
+        let meaningNoParen = meaningRaw.replace(/\s*\(.*?\)\s*/g, '').trim();
+        let base = meaningRaw.replace(/^to /, '').split(',')[0].trim();
 
-      // Try to match exact phrase for all tenses/pronouns
-      for (let t of tenses) {
-        if (!verb.conjugations[t]) continue;
-        for (let i = 0; i < pronouns.length; ++i) {
-          const eng = buildEnglishPhrase(verb, t, i, idx).toLowerCase();
-          if (phrase === eng) {
-            return { verb, tense: t, pronounIdx: i, meaningIdx: idx };
+        // Try to match exact phrase for all tenses/pronouns
+        for (let t of tenses) {
+          if (!hasTense(verb, t)) continue;
+          for (let i = 0; i < pronouns.length; ++i) {
+            const eng = buildEnglishPhrase(verb, t, i, idx).toLowerCase();
+            if (phrase === eng) {
+              return { verb, tense: t, pronounIdx: i, meaningIdx: idx };
+            }
           }
         }
-      }
 
-      // Try to match base infinitive, or phrase matches meaning without parens
-      if (
-        phrase === meaningRaw ||
-        phrase === meaningNoParen ||
-        meaningRaw.startsWith(phrase) ||
-        meaningNoParen.startsWith(phrase) ||
-        phrase === base
-      ) {
-        candidates.push({ verb, tense: null, pronounIdx: null, meaningIdx: idx });
+        // Try to match base infinitive, or phrase matches meaning without parens
+        if (
+          phrase === meaningRaw ||
+          phrase === meaningNoParen ||
+          meaningRaw.startsWith(phrase) ||
+          meaningNoParen.startsWith(phrase) ||
+          phrase === base
+        ) {
+          candidates.push({ verb, tense: null, pronounIdx: null, meaningIdx: idx });
+        }
       }
     }
   }
@@ -672,25 +822,11 @@ function parseEnglishPhrase(phrase, meaningIdx = 0) {
   return null;
 }
 
-// --- Helper: Build English phrase for a verb/tense/pronoun ---
-function buildEnglishPhrase(verb, tense, pronounIdx, meaningIdx = 0) {
-  const pronoun = pronouns[pronounIdx];
-  let meanings = Array.isArray(verb.english) ? verb.english : [verb.english];
-  // --- Patch: always show "shows possession" in UI ---
-  let meaning = meanings[meaningIdx];
-  if (meaning === "to have (possession)") {
-    meaning = "to have (shows possession)";
-    meanings[meaningIdx] = meaning;
-  }
-  let base = meaning.replace(/^to /, '').split(',')[0].trim();
-
-  // Remove parenthetical notes for matching irregulars
-  let normalizedMeaning = meaning.replace(/\s*\(.*?\)\s*/g, '').toLowerCase();
-
-  // Irregulars lookup (expand as needed)
-const irregulars = {
+// English past tense and past participle for irregular and spelling-change verbs
+// (expand as needed; english_index.py keeps the same table)
+const englishIrregulars = {
   // Core irregular verbs
-  "to be": { preterite: pronoun === "I" ? "was" : (["He", "She", "It"].includes(pronoun) ? "was" : "were"), pastPart: "been" },
+  "to be": { preterite: "were", pastPart: "been" }, // "was" for I/he, see buildEnglishPhrase
   "to have": { preterite: "had", pastPart: "had" },
   "to do": { preterite: "did", pastPart: "done" },
   "to go": { preterite: "went", pastPart: "gone" },
@@ -836,12 +972,28 @@ const irregulars = {
   "to require": { preterite: "required", pastPart: "required" }
 };
 
+// --- Helper: Build English phrase for a verb/tense/pronoun ---
+function buildEnglishPhrase(verb, tense, pronounIdx, meaningIdx = 0) {
+  const pronoun = pronouns[pronounIdx];
+  let meanings = Array.isArray(verb.english) ? verb.english : [verb.english];
+  // --- Patch: always show "shows possession" in UI ---
+  let meaning = meanings[meaningIdx];
+  if (meaning === "to have (possession)") {
+    meaning = "to have (shows possession)";
+    meanings[meaningIdx] = meaning;
+  }
+  let base = meaning.replace(/^to /, '').split(',')[0].trim();
+
+  // Remove parenthetical notes for matching irregulars
+  let normalizedMeaning = meaning.replace(/\s*\(.*?\)\s*/g, '').toLowerCase();
+
+
   // Try to find irregular by normalized meaning (for multi-meaning verbs)
   let irregularKey = normalizedMeaning;
   // Also check for multi-word verbs (e.g., "fall asleep")
-  if (!irregulars[irregularKey] && meaning.toLowerCase().startsWith("to ")) {
+  if (!englishIrregulars[irregularKey] && meaning.toLowerCase().startsWith("to ")) {
     let multiWordKey = meaning.toLowerCase();
-    if (irregulars[multiWordKey]) irregularKey = multiWordKey;
+    if (englishIrregulars[multiWordKey]) irregularKey = multiWordKey;
   }
   // Improved regular verb past tense logic: double consonant if CVC and ends with single consonant (not w, x, y)
   function regularPast(base) {
@@ -853,9 +1005,10 @@ const irregulars = {
   }
   let preterite = regularPast(base);
   let pastPart = preterite;
-  if (irregulars[irregularKey]) {
-    preterite = irregulars[irregularKey].preterite;
-    pastPart = irregulars[irregularKey].pastPart;
+  if (englishIrregulars[irregularKey]) {
+    preterite = englishIrregulars[irregularKey].preterite;
+    pastPart = englishIrregulars[irregularKey].pastPart;
+    if (irregularKey === "to be" && ["I", "He", "She", "It"].includes(pronoun)) preterite = "was";
   }
 
   // Present 3rd person singular
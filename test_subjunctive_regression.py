@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Regression check for the subjunctive rule engine.
+Compares add_subjunctive_helper.py against subjunctive_regression.json, the 47
+hand-typed tables the engine replaced (with the old "encontáramos" typo
+corrected), both with the catalog's full paradigms and with only the present
+tense, which exercises the fallbacks used when no preterite is stored.
+Run with: python test_subjunctive_regression.py
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from add_subjunctive_helper import VERBS_PATH, conjugate_subjunctive, get_regular_subjunctive, load_verbs
+
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'subjunctive_regression.json')
+
+# Forms the old tables did not cover, with only the present paradigm to go on
+FALLBACK_CASES = (
+    ('huir', ['huyo', 'huyes', 'huye', 'huimos', 'huís', 'huyen'], 'Imperfect Subjunctive', 'huyéramos'),
+    ('construir', ['construyo', 'construyes', 'construye', 'construimos', 'construís', 'construyen'],
+     'Imperfect Subjunctive', 'construyéramos'),
+    ('reír', ['río', 'ríes', 'ríe', 'reímos', 'reís', 'ríen'], 'Imperfect Subjunctive', 'riéramos'),
+    ('mantener', ['mantengo', 'mantienes', 'mantiene', 'mantenemos', 'mantenéis', 'mantienen'],
+     'Imperfect Subjunctive', 'mantuviéramos'),
+    ('adquirir', ['adquiero', 'adquieres', 'adquiere', 'adquirimos', 'adquirís', 'adquieren'],
+     'Present Subjunctive', 'adquiramos'),
+    ('adquirir', ['adquiero', 'adquieres', 'adquiere', 'adquirimos', 'adquirís', 'adquieren'],
+     'Imperfect Subjunctive', 'adquiriéramos'),
+    ('oler', ['huelo', 'hueles', 'huele', 'olemos', 'oléis', 'huelen'], 'Present Subjunctive', 'olamos'),
+    ('satisfacer', ['satisfago', 'satisfaces', 'satisface', 'satisfacemos', 'satisfacéis', 'satisfacen'],
+     'Imperfect Subjunctive', 'satisficiéramos'),
+)
+
+
+def compare(verb, expected, generated, tenses=None):
+    """
+    List "verb tense: expected != generated" lines for the tenses that differ.
+    """
+    problems = []
+    for tense in tenses or expected:
+        if generated is None or generated.get(tense) != expected[tense]:
+            got = generated.get(tense) if generated else None
+            problems.append(f"{verb} {tense}: {expected[tense]} != {got}")
+    return problems
+
+
+def check_full_paradigms(tables, catalog):
+    problems = []
+    for verb, expected in tables.items():
+        # Verbs outside the catalog (pedir) rely on their override
+        conjugations = catalog[verb]['conjugations'] if verb in catalog else None
+        problems += compare(verb, expected, conjugate_subjunctive(verb, conjugations))
+    return problems
+
+
+def check_present_only(tables, catalog):
+    problems = []
+    for verb, expected in tables.items():
+        if verb in catalog:
+            generated = get_regular_subjunctive(verb, catalog[verb]['conjugations']['Present'])
+            problems += compare(verb, expected, generated, ('Present Subjunctive', 'Imperfect Subjunctive'))
+    for verb, present, tense, form in FALLBACK_CASES:
+        got = get_regular_subjunctive(verb, present)[tense][3]
+        if got != form:
+            problems.append(f"{verb} {tense}: {form} != {got}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--tables', default=TABLES_PATH, help='path to the expected subjunctive tables')
+    args = parser.parse_args(argv)
+
+    with open(args.tables, encoding='utf-8') as f:
+        tables = json.load(f)
+    catalog = {}
+    for verb in load_verbs(args.verbs):
+        catalog.setdefault(verb['spanish'], verb)
+
+    failed = 0
+    for name, check in (('matches the old tables with the catalog paradigms', check_full_paradigms),
+                        ('matches the old tables from the present tense alone', check_present_only)):
+        problems = check(tables, catalog)
+        print(f"{'FAIL' if problems else 'PASS'} {name}")
+        for problem in problems:
+            print(f"  {problem}")
+        failed += bool(problems)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
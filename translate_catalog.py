@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Local verb catalog for the translate functions.
+Writes translate_catalog.json, which netlify/functions/translate.js and
+api/translate.js check before calling the external translation API, so
+infinitives and their English meanings are answered without a network round
+trip. Conjugated forms are only used to recognise Spanish text without a
+detect call; their translation still comes from the provider.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+from add_subjunctive_helper import COMPOUND_AUXILIARIES, VERBS_PATH, generate_subjunctive_batch
+from reverse_index import TENSE_SHIFT, TENSES, VERB_SHIFT, check_packing, fold_accents
+from verb_store import load_catalog, source_hash
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translate_catalog.json')
+
+# Same order as spanishPronouns in slt_script.js
+SPANISH_PRONOUNS = ('yo', 'tú', 'él/ella/usted', 'nosotros', 'vosotros', 'ellos/ellas/ustedes')
+
+_PARENTHETICAL = re.compile(r'\s*\(.*?\)\s*')
+
+
+def catalog_key(text):
+    """
+    Lookup key shared with the translate functions: accent-folded, lowercased,
+    whitespace collapsed and surrounding punctuation dropped.
+    """
+    text = fold_accents(text).replace('ñ', 'n')
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text.strip('¿?¡!.,;:"\'')
+
+
+def build_catalog(verbs, subjunctive=None):
+    """
+    Build the lookup tables for a parsed verb list.
+    Returns a dict with `verbs` ([infinitive, first English meaning] per
+    unique infinitive) and the maps onto it:
+    spanish: infinitive key -> verb id
+    english: English meaning key ("to eat", "eat") -> verb id
+    forms: simple-tense form key -> verb id * 128 + tense * 8 + person
+    participles: participle key -> verb id; compound forms are matched as
+    auxiliary + participle, with auxiliaries: auxiliary key -> tense * 8 + person
+    Leading subject pronouns are stripped by the caller, not stored.
+    """
+    check_packing()
+    if subjunctive is None:
+        subjunctive = generate_subjunctive_batch(verbs)
+    tense_ids = {tense: i for i, tense in enumerate(TENSES)}
+    entries = []
+    spanish = {}
+    english = {}
+    forms = {}
+    participles = {}
+    auxiliaries = {}
+    for tense, auxes in COMPOUND_AUXILIARIES.items():
+        for person, aux in enumerate(auxes):
+            auxiliaries.setdefault(catalog_key(aux), tense_ids[tense] * TENSE_SHIFT + person)
+    for verb in verbs:
+        key = catalog_key(verb['spanish'])
+        if key in spanish:
+            verb_id = spanish[key]
+        else:
+            meanings = verb['english'] if isinstance(verb['english'], list) else [verb['english']]
+            verb_id = spanish[key] = len(entries)
+            entries.append([verb['spanish'], meanings[0]])
+            for meaning in meanings:
+                bare = _PARENTHETICAL.sub(' ', meaning).strip()
+                for variant in (meaning, bare, re.sub(r'^to ', '', bare)):
+                    english.setdefault(catalog_key(variant), verb_id)
+
+        conjugations = dict(subjunctive.get(verb['spanish'], {}))
+        conjugations.update(verb['conjugations'])
+        for tense, tense_forms in conjugations.items():
+            if tense not in tense_ids:
+                continue
+            for person, form in enumerate(tense_forms[:6]):
+                if tense in COMPOUND_AUXILIARIES:
+                    head, _, participle = form.partition(' ')
+                    if head == COMPOUND_AUXILIARIES[tense][person] and participle:
+                        participles.setdefault(catalog_key(participle), verb_id)
+                        continue
+                # Earlier verbs win ambiguous forms, as in practice mode
+                forms.setdefault(catalog_key(form), verb_id * VERB_SHIFT + tense_ids[tense] * TENSE_SHIFT + person)
+    # Forms that are also infinitives ("ser", "amar") are answered as infinitives
+    for key in spanish:
+        forms.pop(key, None)
+    return {
+        'version': 1,
+        'tenses': list(TENSES),
+        'pronouns': list(SPANISH_PRONOUNS),
+        'verbs': entries,
+        'spanish': spanish,
+        'english': english,
+        'forms': forms,
+        'participles': participles,
+        'auxiliaries': auxiliaries,
+    }
+
+
+def write_catalog(verbs_path=VERBS_PATH, output_path=CATALOG_PATH):
+    catalog = build_catalog(load_catalog(verbs_path))
+    catalog['sourceHash'] = source_hash(verbs_path).hex()
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, output_path)
+    return catalog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--output', default=CATALOG_PATH, help='path to the catalog JSON')
+    args = parser.parse_args(argv)
+
+    catalog = write_catalog(args.verbs, args.output)
+    print(f"Wrote {len(catalog['verbs'])} verbs and {len(catalog['forms'])} forms "
+          f"to {args.output} ({os.path.getsize(args.output)} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+// Shared by netlify/functions/translate.js and api/translate.js: the result
+// cache, request coalescing and the local verb catalog lookup. Deployed next to
+// translate_catalog.json through included_files (netlify.toml) / includeFiles (vercel.json).
+
+const path = require('path');
+
+// Local verb catalog generated by translate_catalog.py (optional, same lookup as language_aliases.json)
+let verbCatalog = null;
+try {
+  verbCatalog = require(path.join(__dirname, 'translate_catalog.json'));
+} catch (e) {
+  verbCatalog = null;
+}
+
+// --- Result cache ---
+// Warm function instances keep this module loaded, so repeated practice phrases
+// are answered from memory. Entries expire after a TTL and the least recently
+// used entry is dropped once the cache is full (Map keeps insertion order).
+const CACHE_MAX_ENTRIES = parseInt(process.env.TRANSLATE_CACHE_MAX_ENTRIES || '500', 10);
+const CACHE_TTL_MS = parseInt(process.env.TRANSLATE_CACHE_TTL_MS || String(6 * 60 * 60 * 1000), 10);
+
+class TTLCache {
+  constructor(maxEntries, ttlMs) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.entries = new Map();
+    this.hits = 0;
+    this.misses = 0;
+    this.evictions = 0;
+    this.expirations = 0;
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      this.misses++;
+      return undefined;
+    }
+    this.entries.delete(key);
+    if (entry.expires <= Date.now()) {
+      this.expirations++;
+      this.misses++;
+      return undefined;
+    }
+    this.entries.set(key, entry);
+    this.hits++;
+    return entry.value;
+  }
+
+  set(key, value) {
+    if (this.maxEntries <= 0) return;
+    this.entries.delete(key);
+    this.entries.set(key, { value, expires: Date.now() + this.ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+      this.evictions++;
+    }
+  }
+
+  stats() {
+    return {
+      size: this.entries.size,
+      maxEntries: this.maxEntries,
+      ttlMs: this.ttlMs,
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      expirations: this.expirations
+    };
+  }
+}
+
+// --- Request coalescing ---
+// Cache misses that arrive within TRANSLATE_BATCH_WINDOW_MS of each other are
+// sent upstream together: one multi-text request per language pair. Identical
+// requests that are already in flight share that request's result.
+// TRANSLATE_COALESCE=0 sends every request on its own.
+const COALESCE = process.env.TRANSLATE_COALESCE !== '0';
+const BATCH_WINDOW_MS = parseInt(process.env.TRANSLATE_BATCH_WINDOW_MS || '5', 10);
+
+// `maxItems` is the provider's limit on texts per request
+class MicroBatcher {
+  constructor(send, maxItems) {
+    this.send = send;
+    this.maxItems = maxItems;
+    this.pending = new Map();
+    this.inFlight = new Map();
+    this.batches = 0;
+    this.items = 0;
+    this.deduped = 0;
+  }
+
+  // `key` identifies identical requests, `group` the requests that can share a batch
+  request(key, group, args, q) {
+    if (!COALESCE) {
+      this.batches++;
+      this.items++;
+      return this.send([q], ...args).then(results => results[0]);
+    }
+    if (this.inFlight.has(key)) {
+      this.deduped++;
+      return this.inFlight.get(key);
+    }
+    const promise = new Promise((resolve, reject) => {
+      let batch = this.pending.get(group);
+      if (!batch) {
+        batch = { args, items: [] };
+        batch.timer = setTimeout(() => this.flush(group), BATCH_WINDOW_MS);
+        this.pending.set(group, batch);
+      }
+      batch.items.push({ q, resolve, reject });
+      if (batch.items.length >= this.maxItems) this.flush(group);
+    });
+    this.inFlight.set(key, promise);
+    const done = () => this.inFlight.delete(key);
+    promise.then(done, done);
+    return promise;
+  }
+
+  async flush(group) {
+    const batch = this.pending.get(group);
+    if (!batch) return;
+    this.pending.delete(group);
+    clearTimeout(batch.timer);
+    this.batches++;
+    this.items += batch.items.length;
+    try {
+      const results = await this.send(batch.items.map(item => item.q), ...batch.args);
+      batch.items.forEach((item, i) => item.resolve(results[i]));
+    } catch (err) {
+      batch.items.forEach(item => item.reject(err));
+    }
+  }
+
+  stats() {
+    return {
+      enabled: COALESCE,
+      windowMs: BATCH_WINDOW_MS,
+      maxItems: this.maxItems,
+      batches: this.batches,
+      items: this.items,
+      deduped: this.deduped
+    };
+  }
+}
+
+// Cache key text: the same phrase with different spacing or Unicode composition shares an entry
+function normalizeText(q) {
+  return String(q).normalize('NFC').replace(/\s+/g, ' ').trim();
+}
+
+// Catalog key: mirrors catalog_key() in translate_catalog.py
+function catalogKey(q) {
+  return String(q).normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase()
+    .replace(/\s+/g, ' ').trim()
+    .replace(/^[¿?¡!.,;:"']+|[¿?¡!.,;:"']+$/g, '');
+}
+
+const SUBJECT_PRONOUN = /^(yo|tu|el|ella|usted|nosotros|nosotras|vosotros|vosotras|ellos|ellas|ustedes)\s+/;
+
+// Spanish catalog hit for a key: a verb id (infinitive) or a packed verb/tense/person form
+function findSpanishVerb(key) {
+  if (!verbCatalog) return null;
+  if (verbCatalog.spanish[key] !== undefined) return { verbId: verbCatalog.spanish[key] };
+  const bare = key.replace(SUBJECT_PRONOUN, '');
+  let packed = verbCatalog.forms[bare];
+  if (packed === undefined) {
+    // Compound tenses are stored as auxiliary + participle
+    const space = bare.indexOf(' ');
+    const aux = space > 0 ? verbCatalog.auxiliaries[bare.slice(0, space)] : undefined;
+    const verbId = space > 0 ? verbCatalog.participles[bare.slice(space + 1)] : undefined;
+    if (aux !== undefined && verbId !== undefined) packed = verbId * 128 + aux;
+  }
+  if (packed === undefined) return null;
+  return { verbId: Math.floor(packed / 128), tense: Math.floor(packed / 8) % 16, person: packed % 8 };
+}
+
+// Accented vowels, ñ and inverted punctuation never occur in English input
+const SPANISH_LETTERS = /[áéíóúüñ¿¡]/i;
+
+// True when text matching the catalog can only be Spanish: written with a Spanish-only
+// letter, or several words (pronoun + form, auxiliary + participle). Single bare forms
+// such as "he", "sea", "son" or "van" are ordinary English words too.
+function isSpanishOnly(q) {
+  return SPANISH_LETTERS.test(String(q).normalize('NFC')) || catalogKey(q).includes(' ');
+}
+
+// Answer known verbs locally so they never reach the translation API. Only lookups that
+// are real translations are answered here: an infinitive gets its English meaning and
+// "to ..." its infinitive. Conjugated forms ("comí", "está", "como") go to the provider,
+// which can translate them in context.
+function lookupCatalog(q, source, target) {
+  if (!verbCatalog) return null;
+  const key = catalogKey(q);
+  if ((!source || source === 'es') && target === 'en') {
+    const verbId = verbCatalog.spanish[key];
+    if (verbId !== undefined) return verbCatalog.verbs[verbId][1];
+  }
+  if ((!source || source === 'en') && target === 'es' && key.startsWith('to ')) {
+    const verbId = verbCatalog.english[key];
+    if (verbId !== undefined) return verbCatalog.verbs[verbId][0];
+  }
+  return null;
+}
+
+module.exports = {
+  verbCatalog,
+  CACHE_MAX_ENTRIES,
+  CACHE_TTL_MS,
+  TTLCache,
+  MicroBatcher,
+  normalizeText,
+  catalogKey,
+  findSpanishVerb,
+  isSpanishOnly,
+  lookupCatalog
+};
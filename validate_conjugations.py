@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Validate the stored paradigms in slt_verbs.js against what the rules generate.
+The verb list is sharded across a process pool; each worker reads its shard
+from the compiled verb store and the diffs are streamed as JSON lines.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import profiling
+from add_subjunctive_helper import (
+    COMPOUND_AUXILIARIES, SUBJUNCTIVE_CONJUGATIONS, VERBS_PATH, bare_form, conjugate_subjunctive,
+    decorate_forms, enable_profiling, ending_class, past_participle, spell_before_e, split_infinitive,
+    stem_change, stored_participle,
+)
+from morph_cache import cache_stats, configure, merge_stats, reset_stats
+from verb_store import STORE_PATH, VerbStore, open_store
+
+PRESENT_SUFFIXES = {
+    'ar': ('o', 'as', 'a', 'amos', 'áis', 'an'),
+    'er': ('o', 'es', 'e', 'emos', 'éis', 'en'),
+    'ir': ('o', 'es', 'e', 'imos', 'ís', 'en'),
+    'ír': ('o', 'es', 'e', 'ímos', 'ís', 'en'),
+}
+IMPERFECT_SUFFIXES = {
+    'aba': ('aba', 'abas', 'aba', 'ábamos', 'abais', 'aban'),
+    'ía': ('ía', 'ías', 'ía', 'íamos', 'íais', 'ían'),
+}
+VOWELS = set('aeiouáéíóú')
+FUTURE_SUFFIXES = ('é', 'ás', 'á', 'emos', 'éis', 'án')
+CONDITIONAL_SUFFIXES = ('ía', 'ías', 'ía', 'íamos', 'íais', 'ían')
+
+
+def _boot_stem(core, yo_stem):
+    """
+    Stem of the tú/él/ellos present forms, undoing the yo-only spelling
+    change (elijo/eliges, venzo/vences, sigo/sigues).
+    """
+    infinitive_stem = core[:-2]
+    if infinitive_stem.endswith('gu') and yo_stem.endswith('g'):
+        return yo_stem + 'u'
+    if infinitive_stem.endswith('g') and yo_stem.endswith('j'):
+        return yo_stem[:-1] + 'g'
+    if infinitive_stem.endswith('c') and yo_stem.endswith('z'):
+        return yo_stem[:-1] + 'c'
+    return yo_stem
+
+
+def _expected_present(core, forms):
+    yo = forms[0]
+    if not yo.endswith('o'):
+        return None
+    suffixes = PRESENT_SUFFIXES['ír' if core.endswith('ír') else ending_class(core)]
+    yo_stem = yo[:-1]
+    expected = [None] * 6
+    expected[0] = yo
+    # nosotros/vosotros always keep the infinitive stem (cerramos, pedimos, tenemos)
+    expected[3] = core[:-2] + suffixes[3]
+    # Monosyllables drop the written accent (veis, not véis)
+    expected[4] = core[:-2] + (suffixes[4] if VOWELS & set(core[:-2]) else suffixes[4].replace('é', 'e'))
+    boot = _boot_stem(core, yo_stem)
+    if boot == core[:-2] or stem_change(core, yo_stem) is not None:
+        for person in (1, 2, 5):
+            expected[person] = boot + suffixes[person]
+    return expected
+
+
+def _expected_preterite(core, forms):
+    yo, ellos = forms[0], forms[5]
+    if ending_class(core) == 'ar' and ellos.endswith('aron'):
+        # Regular -ar preterite keeps the infinitive stem (tropecé, tropezaron)
+        stem = core[:-2]
+        return [spell_before_e(stem) + 'é', stem + 'aste', stem + 'ó', stem + 'amos', stem + 'asteis', stem + 'aron']
+    if yo.endswith('í') and ellos.endswith('eron'):
+        # Weak -er/-ir preterite; third persons take the ellos stem (pidió, leyó)
+        stem = yo[:-1]
+        third = ellos[:-5] if ellos.endswith('ieron') else ellos[:-4]
+        accent = 'í' if stem and stem[-1] in 'aeo' else 'i'
+        return [yo, stem + accent + 'ste', third + 'ió' if ellos.endswith('ieron') else third + 'ó',
+                stem + accent + 'mos', stem + accent + 'steis', ellos]
+    if yo.endswith('e') and ellos.endswith('eron'):
+        # Strong preterite (tuve, supe, dije); hizo keeps its c/z spelling
+        stem = yo[:-1]
+        third = stem[:-1] + 'z' if stem.endswith('c') else stem
+        return [yo, stem + 'iste', third + 'o', stem + 'imos', stem + 'isteis', ellos]
+    return None
+
+
+def _expected_imperfect(core, forms):
+    for ending, suffixes in IMPERFECT_SUFFIXES.items():
+        if forms[0].endswith(ending):
+            stem = forms[0][:-len(ending)]
+            return [stem + suffix for suffix in suffixes]
+    return None
+
+
+def _expected_future(core, forms):
+    stem = forms[0][:-1] if forms[0].endswith('é') else core.replace('í', 'i')
+    return [stem + suffix for suffix in FUTURE_SUFFIXES]
+
+
+def _expected_conditional(core, forms):
+    stem = forms[0][:-2] if forms[0].endswith('ía') else core.replace('í', 'i')
+    return [stem + suffix for suffix in CONDITIONAL_SUFFIXES]
+
+
+SIMPLE_TENSE_RULES = {
+    'Present': _expected_present,
+    'Preterite': _expected_preterite,
+    'Imperfect': _expected_imperfect,
+    'Future': _expected_future,
+    'Conditional': _expected_conditional,
+}
+
+
+def expected_paradigms(verb):
+    """
+    Return {tense: [6 expected forms or None]} for every stored tense the rules
+    can derive. None marks a person the rules do not predict.
+    """
+    spanish_verb = verb['spanish']
+    conjugations = verb['conjugations']
+    if ending_class(spanish_verb) is None:
+        return {}
+    core, reflexive, tail = split_infinitive(spanish_verb)
+    expected = {}
+    for tense, rule in SIMPLE_TENSE_RULES.items():
+        forms = conjugations.get(tense)
+        if not forms or len(forms) != 6 or core in SUBJUNCTIVE_CONJUGATIONS:
+            # Suppletive verbs (ser, ir, estar...) have no simple-tense rule
+            continue
+        bare = [bare_form(form, reflexive, tail) for form in forms]
+        generated = rule(core, bare)
+        if generated is not None:
+            expected[tense] = [None if form is None else decorated for form, decorated in
+                               zip(generated, decorate_forms([form or '' for form in generated], reflexive, tail))]
+
+    participle = past_participle(core, stored_participle(conjugations, reflexive, tail))
+    for tense, auxiliaries in COMPOUND_AUXILIARIES.items():
+        if tense in conjugations:
+            expected[tense] = decorate_forms([aux + ' ' + participle for aux in auxiliaries], reflexive, tail)
+    subjunctive = conjugate_subjunctive(spanish_verb, conjugations) or {}
+    for tense, forms in subjunctive.items():
+        if tense in conjugations:
+            expected[tense] = forms
+    return expected
+
+
+def validate_verb(index, verb):
+    """
+    Diff records for one catalog entry, one per person that disagrees.
+    """
+    diffs = []
+    for tense, expected in expected_paradigms(verb).items():
+        stored = verb['conjugations'][tense]
+        for person, (have, want) in enumerate(zip(stored, expected)):
+            if want is not None and have != want:
+                diffs.append({
+                    'index': index,
+                    'verb': verb['spanish'],
+                    'tense': tense,
+                    'person': person,
+                    'stored': have,
+                    'expected': want,
+                })
+    return diffs
+
+
+# Validation steps counted per call when profiling is on
+PROFILED_FUNCTIONS = ('expected_paradigms', 'validate_verb', 'conjugate_subjunctive')
+
+
+def validate_shard(store_path, start, stop, cache_size=None, profile=False):
+    """
+    Worker entry point: validate catalog entries [start, stop) from the store.
+    profile: profile this shard in its own process and hand the counters back
+    Returns (start, count, diffs, cache counters for this shard, profile
+    counters or None).
+    """
+    if cache_size is not None:
+        configure(cache_size)
+    if profile:
+        enable_profiling()
+        profiling.instrument(globals(), PROFILED_FUNCTIONS)
+    profiler = profiling.active()
+    reset_stats()
+    diffs = []
+    with profiling.stage('validate'), VerbStore(store_path) as store:
+        for index in range(start, stop):
+            verb = store.verb(index)
+            if profiler is None:
+                diffs.extend(validate_verb(index, verb))
+            else:
+                with profiler.verb(verb['spanish'], 'validate'):
+                    diffs.extend(validate_verb(index, verb))
+    return start, stop - start, diffs, cache_stats(), profiler.drain() if profile else None
+
+
+def run(verbs_path=VERBS_PATH, store_path=STORE_PATH, jobs=None, shard_size=None, out=sys.stdout,
+        cache_size=None, report_caches=False):
+    """
+    Validate the whole catalog and stream one JSON line per diff to `out`,
+    followed by a summary line. Returns the number of diffs found.
+    report_caches: add the morphology cache counters, summed over all shards,
+    to the summary
+    """
+    start_time = time.perf_counter()
+    with profiling.stage('parse'), open_store(verbs_path, store_path) as store:
+        total = len(store)
+    jobs = jobs or os.cpu_count() or 1
+    shard_size = shard_size or max(1, -(-total // (jobs * 4)))
+    shards = [(start, min(start + shard_size, total)) for start in range(0, total, shard_size)]
+
+    found = 0
+    snapshots = []
+    profiler = profiling.active()
+    if jobs == 1:
+        results = (validate_shard(store_path, start, stop, cache_size) for start, stop in shards)
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        results = (future.result() for future in as_completed(
+            [pool.submit(validate_shard, store_path, start, stop, cache_size, profiler is not None)
+             for start, stop in shards]))
+    try:
+        for _, _, diffs, caches, profile in results:
+            snapshots.append(caches)
+            if profile:
+                profiler.merge(profile)
+            with profiling.stage('emit'):
+                for diff in diffs:
+                    out.write(json.dumps(diff, ensure_ascii=False) + '\n')
+                out.flush()
+            found += len(diffs)
+    finally:
+        if jobs != 1:
+            pool.shutdown()
+
+    summary = {
+        'summary': {
+            'verbs': total,
+            'shards': len(shards),
+            'jobs': jobs,
+            'diffs': found,
+            'seconds': round(time.perf_counter() - start_time, 4),
+        }
+    }
+    if report_caches:
+        summary['summary']['caches'] = merge_stats(snapshots)
+    out.write(json.dumps(summary) + '\n')
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--store', default=STORE_PATH, help='path to the compiled verb store')
+    parser.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--shard-size', type=int, help='catalog entries per shard')
+    parser.add_argument('--output', help='write the JSON-lines report to this file (default: stdout)')
+    parser.add_argument('--cache-size', type=int, help='entries kept per morphology cache (0 disables caching)')
+    parser.add_argument('--cache-stats', action='store_true',
+                        help='include morphology cache counters in the summary line')
+    parser.add_argument('--profile', metavar='PATH',
+                        help=f'write per-stage timings and a trace-event profile to PATH (or set {profiling.PROFILE_ENV})')
+    args = parser.parse_args(argv)
+    if args.profile:
+        enable_profiling()
+        profiling.instrument(globals(), PROFILED_FUNCTIONS)
+
+    options = {'cache_size': args.cache_size, 'report_caches': args.cache_stats}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as out:
+            found = run(args.verbs, args.store, args.jobs, args.shard_size, out, **options)
+    else:
+        found = run(args.verbs, args.store, args.jobs, args.shard_size, **options)
+    if args.profile:
+        profiling.write_report(args.profile)
+        print(f"Wrote profile to {args.profile}", file=sys.stderr)
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Split the verb catalog into lazily-loaded browser bundles.
+Writes bundles/manifest.json plus content-hashed shard files, one per
+frequency tier and tense group, so slt_script.js can start from the core
+Present/Preterite data and fetch the other tenses only when they are shown.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+from add_subjunctive_helper import SUBJUNCTIVE_TENSES, VERBS_PATH, generate_subjunctive_batch
+from reverse_index import TENSES
+from verb_store import load_catalog, source_hash
+
+BUNDLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bundles')
+
+# Tense groups in load order; the first one is fetched eagerly on page load
+TENSE_GROUPS = (
+    ('core', ('Present', 'Preterite')),
+    ('indicative', ('Imperfect', 'Future', 'Conditional')),
+    ('perfect', ('Present Perfect', 'Past Perfect', 'Future Perfect', 'Conditional Perfect')),
+    ('subjunctive', SUBJUNCTIVE_TENSES),
+)
+EAGER_GROUPS = ('core',)
+
+# The catalog has no usage counts; it lists the most common verbs first, so
+# frequency tiers are catalog position ranges: [0, 50), [50, 150), [150, end)
+TIER_BOUNDS = (50, 150)
+
+HASHED_NAME = re.compile(r'^[a-z]+(\.\d+)?\.[0-9a-f]{12}\.json$')
+
+
+def _tiers(verb_count):
+    """
+    (start, stop) catalog ranges for each frequency tier.
+    """
+    bounds = [0] + [bound for bound in TIER_BOUNDS if bound < verb_count] + [verb_count]
+    return list(zip(bounds, bounds[1:]))
+
+
+def _dump(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_hashed(directory, stem, data):
+    """
+    Write data under `<stem>.<content hash>.json` and return the file name.
+    Identical content keeps its name, so unchanged shards stay cached.
+    """
+    name = f'{stem}.{hashlib.sha256(data).hexdigest()[:12]}.json'
+    path = os.path.join(directory, name)
+    if not os.path.exists(path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return name
+
+
+def build_bundles(verbs, subjunctive=None):
+    """
+    Split a parsed verb list into bundle payloads.
+    subjunctive: generated subjunctive tenses per infinitive, used for verbs
+    whose catalog entry does not store them
+    Returns (verb metadata, {(group, tier): shard payload}).
+    """
+    if subjunctive is None:
+        subjunctive = generate_subjunctive_batch(verbs)
+    tense_bits = {tense: 1 << i for i, tense in enumerate(TENSES)}
+
+    paradigms = []
+    meta = []
+    for verb in verbs:
+        conjugations = dict(subjunctive.get(verb['spanish'], {}))
+        conjugations.update(verb['conjugations'])
+        paradigms.append(conjugations)
+        meta.append({
+            'english': verb['english'],
+            'spanish': verb['spanish'],
+            'type': verb.get('type', ''),
+            'memoryTip': verb.get('memoryTip', ''),
+            # Bitmask over TENSES, so tense availability is known before a shard loads
+            'tenses': sum(bit for tense, bit in tense_bits.items() if tense in conjugations),
+        })
+
+    shards = {}
+    for tier, (start, stop) in enumerate(_tiers(len(verbs))):
+        for group, group_tenses in TENSE_GROUPS:
+            shards[group, tier] = {
+                'group': group,
+                'tier': tier,
+                'start': start,
+                'tenses': list(group_tenses),
+                'forms': [[paradigms[i].get(tense) for tense in group_tenses] for i in range(start, stop)],
+            }
+    return meta, shards
+
+
+def write_bundles(verbs_path=VERBS_PATH, output_dir=BUNDLE_DIR):
+    """
+    Build the bundles from slt_verbs.js, write them to output_dir and remove
+    hashed files the new manifest no longer references.
+    Returns the manifest.
+    """
+    verbs = load_catalog(verbs_path)
+    meta, shards = build_bundles(verbs)
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = {
+        'version': 1,
+        'sourceHash': source_hash(verbs_path).hex(),
+        'verbCount': len(verbs),
+        'tenses': list(TENSES),
+        'tiers': [list(bounds) for bounds in _tiers(len(verbs))],
+        'eager': list(EAGER_GROUPS),
+        'groups': {group: list(group_tenses) for group, group_tenses in TENSE_GROUPS},
+        'verbs': _write_hashed(output_dir, 'verbs', _dump(meta)),
+        'shards': {},
+        'bytes': {},
+    }
+    for (group, tier), payload in shards.items():
+        data = _dump(payload)
+        name = _write_hashed(output_dir, f'{group}.{tier}', data)
+        manifest['shards'].setdefault(group, []).append(name)
+        manifest['bytes'][group] = manifest['bytes'].get(group, 0) + len(data)
+    manifest['bytes']['verbs'] = os.path.getsize(os.path.join(output_dir, manifest['verbs']))
+
+    keep = {manifest['verbs']} | {name for names in manifest['shards'].values() for name in names}
+    for name in os.listdir(output_dir):
+        if HASHED_NAME.match(name) and name not in keep:
+            os.remove(os.path.join(output_dir, name))
+
+    tmp_path = os.path.join(output_dir, 'manifest.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, os.path.join(output_dir, 'manifest.json'))
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--output', default=BUNDLE_DIR, help='bundle directory')
+    args = parser.parse_args(argv)
+
+    manifest = write_bundles(args.verbs, args.output)
+    sizes = manifest['bytes']
+    eager = sizes['verbs'] + sum(sizes[group] for group in manifest['eager'])
+    print(f"Wrote {sum(len(names) for names in manifest['shards'].values())} shards for "
+          f"{manifest['verbCount']} verbs to {args.output}")
+    for group, size in sizes.items():
+        print(f"  {group}: {size} bytes")
+    print(f"First load: {eager} of {sum(sizes.values())} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
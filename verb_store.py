@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Compiled, indexed verb store for the Python tooling.
+Parses the `verbs` array in slt_verbs.js once and saves it as a compact binary
+artifact that later runs memory-map instead of re-tokenizing the JS source.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+from add_subjunctive_helper import VERBS_PATH, load_verbs
+
+STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'slt_verbs.bin')
+
+MAGIC = b'SLTV'
+VERSION = 1
+PERSONS = 6
+MISSING = 0xFFFFFFFF
+
+# magic, version, tense count, sha256 of slt_verbs.js, then section counts and offsets
+HEADER = struct.Struct('<4sHH32s5I8I')
+# spanish, type and memoryTip string ids, first english id, english count
+VERB_HEAD = struct.Struct('<5I')
+TYPE_ENTRY = struct.Struct('<3I')
+
+
+def source_hash(path=VERBS_PATH):
+    """
+    SHA-256 of the slt_verbs.js source, used to tell whether a store is stale.
+    """
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def fnv1a(text):
+    """
+    32-bit FNV-1a hash of a UTF-8 string, used for the infinitive index.
+    """
+    h = 0x811C9DC5
+    for byte in text.encode('utf-8'):
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def _tense_order(verbs):
+    """
+    Tense names in order of first appearance in the catalog.
+    """
+    tenses = []
+    for verb in verbs:
+        for tense in verb['conjugations']:
+            if tense not in tenses:
+                tenses.append(tense)
+    return tenses
+
+
+def compile_store(verbs_path=VERBS_PATH, output_path=STORE_PATH, verbs=None):
+    """
+    Compile slt_verbs.js into the binary store at output_path.
+    verbs: already parsed verb list (parsed from verbs_path when omitted)
+    Returns the number of verb records written.
+    """
+    digest = source_hash(verbs_path)
+    if verbs is None:
+        verbs = load_verbs(verbs_path)
+    tenses = _tense_order(verbs)
+
+    # Intern every string so each distinct form is stored once
+    strings = []
+    string_ids = {}
+
+    def intern(text):
+        sid = string_ids.get(text)
+        if sid is None:
+            sid = string_ids[text] = len(strings)
+            strings.append(text)
+        return sid
+
+    tense_ids = [intern(tense) for tense in tenses]
+    english_ids = []
+    records = bytearray()
+    by_type = {}
+    for index, verb in enumerate(verbs):
+        meanings = verb['english'] if isinstance(verb['english'], list) else [verb['english']]
+        records += VERB_HEAD.pack(intern(verb['spanish']), intern(verb.get('type', '')),
+                                  intern(verb.get('memoryTip', '')), len(english_ids), len(meanings))
+        english_ids.extend(intern(meaning) for meaning in meanings)
+        for tense in tenses:
+            forms = verb['conjugations'].get(tense, [])
+            slots = [intern(form) for form in forms[:PERSONS]]
+            slots += [MISSING] * (PERSONS - len(slots))
+            records += struct.pack('<6I', *slots)
+        by_type.setdefault(verb.get('type', ''), []).append(index)
+
+    # Open-addressed hash table on the infinitive; first catalog entry wins
+    n_slots = 1
+    while n_slots < len(verbs) * 2:
+        n_slots <<= 1
+    table = [MISSING] * n_slots
+    placed = set()
+    for index, verb in enumerate(verbs):
+        if verb['spanish'] in placed:
+            continue
+        placed.add(verb['spanish'])
+        slot = fnv1a(verb['spanish']) & (n_slots - 1)
+        while table[slot] != MISSING:
+            slot = (slot + 1) & (n_slots - 1)
+        table[slot] = index
+
+    blob = bytearray()
+    string_offsets = []
+    for text in strings:
+        string_offsets.append(len(blob))
+        blob += text.encode('utf-8')
+    string_offsets.append(len(blob))
+
+    type_entries = bytearray()
+    type_members = []
+    for type_name, members in by_type.items():
+        type_entries += TYPE_ENTRY.pack(intern(type_name), len(type_members), len(members))
+        type_members.extend(members)
+
+    sections = [
+        struct.pack(f'<{len(string_offsets)}I', *string_offsets),
+        bytes(blob),
+        struct.pack(f'<{len(tense_ids)}I', *tense_ids),
+        bytes(records),
+        struct.pack(f'<{len(english_ids)}I', *english_ids),
+        struct.pack(f'<{n_slots}I', *table),
+        bytes(type_entries),
+        struct.pack(f'<{len(type_members)}I', *type_members),
+    ]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        # Keep every section 4-byte aligned so u32 arrays can be cast directly
+        position += -position % 4
+        offsets.append(position)
+        position += len(section)
+
+    header = HEADER.pack(MAGIC, VERSION, len(tenses), digest, len(strings), len(verbs),
+                         len(english_ids), len(by_type), n_slots, *offsets)
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        for offset, section in zip(offsets, sections):
+            f.write(b'\0' * (offset - f.tell()))
+            f.write(section)
+    os.replace(tmp_path, output_path)
+    return len(verbs)
+
+
+class VerbStore:
+    """
+    Read-only view over a compiled store. Strings are decoded lazily and
+    cached, so looking up one verb only touches the bytes it needs.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = HEADER.unpack_from(self._mmap, 0)
+        magic, version, n_tenses, digest = header[:4]
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f'{path} is not a version {VERSION} verb store')
+        self.content_hash = digest
+        n_strings, n_verbs, n_english, n_types, n_slots = header[4:9]
+        (strings_off, blob_off, tenses_off, verbs_off,
+         english_off, index_off, types_off, members_off) = header[9:]
+
+        view = memoryview(self._mmap)
+        self._string_offsets = view[strings_off:strings_off + (n_strings + 1) * 4].cast('I')
+        self._blob_off = blob_off
+        self._strings = [None] * n_strings
+        self._records = view[verbs_off:verbs_off + n_verbs * (VERB_HEAD.size + n_tenses * PERSONS * 4)].cast('I')
+        self._english = view[english_off:english_off + n_english * 4].cast('I')
+        self._index = view[index_off:index_off + n_slots * 4].cast('I')
+        self._members = view[members_off:].cast('I') if n_types else []
+        self._record_words = VERB_HEAD.size // 4 + n_tenses * PERSONS
+        self._n_verbs = n_verbs
+        self.tenses = [self._string(sid) for sid in view[tenses_off:tenses_off + n_tenses * 4].cast('I')]
+        self._tense_slots = {tense: 5 + i * PERSONS for i, tense in enumerate(self.tenses)}
+
+        self._types = {}
+        for i in range(n_types):
+            sid, start, count = TYPE_ENTRY.unpack_from(self._mmap, types_off + i * TYPE_ENTRY.size)
+            self._types[self._string(sid)] = (start, count)
+
+    def close(self):
+        self._string_offsets.release()
+        self._records.release()
+        self._english.release()
+        self._index.release()
+        if not isinstance(self._members, list):
+            self._members.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._n_verbs
+
+    def __iter__(self):
+        for index in range(self._n_verbs):
+            yield self.verb(index)
+
+    def _string(self, sid):
+        text = self._strings[sid]
+        if text is None:
+            start = self._blob_off + self._string_offsets[sid]
+            end = self._blob_off + self._string_offsets[sid + 1]
+            text = self._strings[sid] = self._mmap[start:end].decode('utf-8')
+        return text
+
+    def index_of(self, spanish_verb):
+        """
+        Record index of an infinitive, or None if it is not in the store.
+        """
+        mask = len(self._index) - 1
+        slot = fnv1a(spanish_verb) & mask
+        while True:
+            index = self._index[slot]
+            if index == MISSING:
+                return None
+            if self._string(self._records[index * self._record_words]) == spanish_verb:
+                return index
+            slot = (slot + 1) & mask
+
+    def verb(self, index):
+        """
+        Decode one record back into the slt_verbs.js dict shape.
+        """
+        base = index * self._record_words
+        spanish_sid, type_sid, tip_sid, english_start, english_count = self._records[base:base + 5]
+        conjugations = {}
+        position = base + 5
+        for tense in self.tenses:
+            slots = self._records[position:position + PERSONS]
+            position += PERSONS
+            forms = [self._string(sid) for sid in slots if sid != MISSING]
+            if forms:
+                conjugations[tense] = forms
+        return {
+            'english': [self._string(sid) for sid in self._english[english_start:english_start + english_count]],
+            'spanish': self._string(spanish_sid),
+            'type': self._string(type_sid),
+            'memoryTip': self._string(tip_sid),
+            'conjugations': conjugations,
+        }
+
+    def lookup(self, spanish_verb):
+        """
+        Verb dict for an infinitive, or None.
+        """
+        index = self.index_of(spanish_verb)
+        return None if index is None else self.verb(index)
+
+    def form(self, spanish_verb, tense, person):
+        """
+        Single conjugated form without decoding the rest of the record.
+        """
+        index = self.index_of(spanish_verb)
+        if index is None or tense not in self._tense_slots:
+            return None
+        sid = self._records[index * self._record_words + self._tense_slots[tense] + person]
+        return None if sid == MISSING else self._string(sid)
+
+    def types(self):
+        return list(self._types)
+
+    def verbs_of_type(self, type_name):
+        """
+        All verb dicts whose `type` field equals type_name.
+        """
+        start, count = self._types.get(type_name, (0, 0))
+        return [self.verb(index) for index in self._members[start:start + count]]
+
+
+def open_store(verbs_path=VERBS_PATH, store_path=STORE_PATH):
+    """
+    Open the compiled store, rebuilding it first if it is missing or was
+    built from a different version of slt_verbs.js.
+    """
+    if os.path.exists(store_path):
+        store = VerbStore(store_path)
+        if store.content_hash == source_hash(verbs_path):
+            return store
+        store.close()
+    compile_store(verbs_path, store_path)
+    return VerbStore(store_path)
+
+
+def load_catalog(verbs_path=VERBS_PATH, store_path=STORE_PATH):
+    """
+    The full verb list, read through the compiled store.
+    """
+    with open_store(verbs_path, store_path) as store:
+        return list(store)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--verbs', default=VERBS_PATH, help='path to slt_verbs.js')
+    parser.add_argument('--store', default=STORE_PATH, help='path to the compiled store')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='compile slt_verbs.js into the store')
+    lookup = subparsers.add_parser('lookup', help='print one verb from the store')
+    lookup.add_argument('infinitive')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        count = compile_store(args.verbs, args.store)
+        print(f"Compiled {count} verbs into {args.store} ({os.path.getsize(args.store)} bytes)")
+        return 0
+
+    with open_store(args.verbs, args.store) as store:
+        verb = store.lookup(args.infinitive)
+    if verb is None:
+        print(f"No verb found for {args.infinitive}", file=sys.stderr)
+        return 1
+    print(json.dumps(verb, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())